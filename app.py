@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 
-from scoring import score_transcript
+from scoring import enable_result_cache, result_cache_enabled, score_transcript
 
 
 def label_overall(score: int) -> str:
@@ -18,6 +18,11 @@ def label_overall(score: int) -> str:
 
 
 def main():
+    # Streamlit re-runs this script on every interaction; keep identical
+    # submissions from being re-scored.
+    if not result_cache_enabled():
+        enable_result_cache(maxsize=256)
+
     st.title("AI-based Self-Introduction Scoring Tool")
     st.write(
         "Paste a student's self-introduction and get a detailed score based on a communication skills rubric.\n\n"
@@ -0,0 +1,150 @@
+"""
+Asyncio-native scoring API.
+
+ascore_transcript / ascore_transcripts return the same results as
+scoring.score_transcript / scoring.score_transcripts, reading and filling
+the result cache and the feature store as they do, without blocking the
+event loop: the sentence-transformer encode and the feature extraction
+(including VADER and any feature store I/O) run in executors, only the
+cheap band lookups run inline on the loop.
+
+Encodes go through a dedicated thread pool of MODEL_CONCURRENCY workers,
+which bounds how many forward passes hit the model at once however many
+coroutines are waiting; the rest queue up without holding the loop.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Sequence
+
+import scoring
+from text_utils import as_analysis
+
+# Torch already parallelises one forward pass across cores, so by default
+# only one encode runs at a time.
+MODEL_CONCURRENCY = 1
+
+_model_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_model_executor() -> ThreadPoolExecutor:
+    """
+    Shared executor for encoder calls (created on first use).
+    """
+    global _model_executor
+    if _model_executor is None:
+        with _executor_lock:
+            if _model_executor is None:
+                _model_executor = ThreadPoolExecutor(
+                    max_workers=MODEL_CONCURRENCY, thread_name_prefix="scorer-model"
+                )
+    return _model_executor
+
+
+def set_model_concurrency(max_concurrent: int) -> None:
+    """
+    Change how many encodes may run at once. Running encodes finish on the
+    old executor; new ones use the new limit.
+    """
+    global MODEL_CONCURRENCY, _model_executor
+    if max_concurrent <= 0:
+        raise ValueError("max_concurrent must be positive")
+    with _executor_lock:
+        old = _model_executor
+        MODEL_CONCURRENCY = max_concurrent
+        _model_executor = None
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _cancel(future) -> None:
+    # On the error path: the executor job cannot be stopped, but its result
+    # (or exception) is no longer awaited or reported.
+    if future is not None and not future.done():
+        future.cancel()
+
+
+async def ascore_transcript(
+    text: scoring.TextInput,
+    duration_sec: float,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+) -> Dict:
+    """
+    Async version of scoring.score_transcript.
+    """
+    semantic = scoring.check_scoring_mode(mode) == "full"
+    loop = asyncio.get_running_loop()
+    analysis = as_analysis(text)
+
+    key, cached = scoring.cached_result(analysis, duration_sec, embedding_mode, mode)
+    if cached is not None:
+        return cached
+
+    sims_future = None
+    if semantic:
+        sims_future = loop.run_in_executor(
+            get_model_executor(),
+            partial(scoring.semantics_for, [analysis], embedding_mode=embedding_mode),
+        )
+    try:
+        features = await loop.run_in_executor(None, scoring.features_for, [analysis])
+        sims = (await sims_future)[0] if sims_future is not None else None
+    except BaseException:
+        _cancel(sims_future)
+        raise
+
+    result = scoring.attach_semantics(scoring.score_features(features[0], duration_sec), sims)
+    scoring.cache_result(key, result)
+    return result
+
+
+async def ascore_transcripts(
+    texts: Sequence[scoring.TextInput],
+    durations: Sequence[float],
+    batch_size: int = scoring.DEFAULT_BATCH_SIZE,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+) -> List[Dict]:
+    """
+    Async version of scoring.score_transcripts: one batched encode for the
+    texts not in the result cache (none with mode="fast"), feature
+    extraction and VADER for them in the default executor.
+    """
+    if len(texts) != len(durations):
+        raise ValueError("texts and durations must have the same length")
+    semantic = scoring.check_scoring_mode(mode) == "full"
+
+    loop = asyncio.get_running_loop()
+    results, keys, pending, analyses = scoring.split_cached(
+        texts, durations, embedding_mode, mode
+    )
+
+    sims_future = None
+    if semantic and analyses:
+        sims_future = loop.run_in_executor(
+            get_model_executor(),
+            partial(
+                scoring.semantics_for,
+                analyses,
+                batch_size=batch_size,
+                embedding_mode=embedding_mode,
+            ),
+        )
+    try:
+        features_list = await loop.run_in_executor(None, scoring.features_for, analyses)
+        for i, features in zip(pending, features_list):
+            results[i] = scoring.score_features(features, durations[i])
+            # let other coroutines run between transcripts of a large batch
+            await asyncio.sleep(0)
+        sims_list = await sims_future if sims_future is not None else [None] * len(pending)
+    except BaseException:
+        _cancel(sims_future)
+        raise
+
+    for i, sims in zip(pending, sims_list):
+        scoring.attach_semantics(results[i], sims)
+        scoring.cache_result(keys[i], results[i])
+    return results
@@ -0,0 +1,344 @@
+"""
+Batch scoring of transcript files.
+
+Usage:
+    python -m scoring batch INPUT OUTPUT [--workers N] [--batch-size N]
+                                         [--unordered] [--embedding-mode MODE]
+                                         [--encoder-backend BACKEND]
+                                         [--bucket-batches N] [--mode fast]
+                                         [--feature-store PATH]
+                                         [--threads-per-worker N]
+
+INPUT is a JSONL or CSV file of {id, text, duration_sec} records; OUTPUT is
+a JSONL file with one {"id": ..., **score_transcript result} line per
+record, written as soon as each batch is scored. With --feature-store,
+features and embeddings are read from (and added to) that SQLite file, so
+re-scoring the same transcripts skips the text analysis and the encoder.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import encoders
+import scoring
+
+RECORD_FIELDS = ("id", "text", "duration_sec")
+
+# Records are scored in chunks of batch_size * DEFAULT_BUCKET_BATCHES: the
+# encoder sorts each chunk by length before splitting it into mini-batches,
+# so the larger the chunk, the less padding a short transcript shares with
+# long ones. Results are still returned in input order.
+DEFAULT_BUCKET_BATCHES = 8
+
+
+# -----------------------------
+# Input / output
+# -----------------------------
+def _normalize_record(raw: Dict, where: str) -> Dict:
+    missing = [field for field in RECORD_FIELDS if raw.get(field) is None]
+    if missing:
+        raise ValueError(f"{where}: missing field(s) {', '.join(missing)}")
+    try:
+        duration_sec = float(raw["duration_sec"])
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: duration_sec must be a number") from None
+    if not math.isfinite(duration_sec):
+        # would write NaN/Infinity (not JSON) into wpm and the measurements
+        raise ValueError(f"{where}: duration_sec must be finite")
+    return {"id": raw["id"], "text": str(raw["text"]), "duration_sec": duration_sec}
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"cannot tell the format of {path!r}; pass --input-format")
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Stream {id, text, duration_sec} records from a JSONL or CSV file.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            for lineno, line in enumerate(f, start=1):
+                if line.strip():
+                    yield _normalize_record(json.loads(line), f"{path}:{lineno}")
+        elif fmt == "csv":
+            for rowno, row in enumerate(csv.DictReader(f), start=2):
+                yield _normalize_record(row, f"{path}:{rowno}")
+        else:
+            raise ValueError(f"unknown input format {fmt!r}")
+
+
+def chunked(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# -----------------------------
+# Workers
+# -----------------------------
+def _init_worker(
+    encoder_backend: str,
+    mode: str,
+    feature_store: Optional[str] = None,
+    threads_per_worker: Optional[int] = None,
+) -> None:
+    """
+    Process-pool initializer: load the model once per worker process.
+    """
+    scoring.set_encoder_backend(encoder_backend)
+    if feature_store is not None:
+        # one connection per process; SQLite serialises the writers
+        scoring.enable_feature_store(feature_store)
+    scoring.warmup(mode)
+    if threads_per_worker is not None and "torch" in sys.modules:
+        import torch
+        # N workers each running a full-width intra-op pool would oversubscribe
+        # the CPU
+        torch.set_num_threads(threads_per_worker)
+
+
+def score_records(
+    records: Sequence[Dict],
+    batch_size: int = scoring.DEFAULT_BATCH_SIZE,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+) -> List[Dict]:
+    """
+    Score one chunk of records; returns {"id": ..., **result} per record.
+    """
+    results = scoring.score_transcripts(
+        [record["text"] for record in records],
+        [record["duration_sec"] for record in records],
+        batch_size=batch_size,
+        embedding_mode=embedding_mode,
+        mode=mode,
+    )
+    return [{"id": record.get("id"), **result} for record, result in zip(records, results)]
+
+
+def iter_scores(
+    records: Iterable[Dict],
+    batch_size: int = scoring.DEFAULT_BATCH_SIZE,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    bucket_batches: int = DEFAULT_BUCKET_BATCHES,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+) -> Iterator[Dict]:
+    """
+    Lazily score a stream of {id, text, duration_sec} records.
+
+    Records are pulled from `records` one chunk of `bucket_batches`
+    embedding batches at a time, scored with score_transcripts (which
+    length-sorts the chunk into mini-batches) and yielded one by one in
+    input order, so only a single chunk of inputs and results is ever held
+    in memory: pair it with read_records() to score a file of any size with
+    flat memory use.
+    """
+    for chunk in chunked(records, batch_size * bucket_batches):
+        yield from score_records(chunk, batch_size, embedding_mode, mode)
+
+
+def _iter_pool_results(
+    chunks: Iterator[List[Dict]],
+    workers: int,
+    batch_size: int,
+    ordered: bool,
+    embedding_mode: str,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+    feature_store: Optional[str] = None,
+    threads_per_worker: Optional[int] = None,
+) -> Iterator[Dict]:
+    # At most 2 chunks per worker are in flight, so memory stays bounded
+    # however large the input file is.
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(scoring.get_encoder_backend(), mode, feature_store, threads_per_worker),
+    ) as pool:
+        in_flight = deque()
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            in_flight.append(
+                pool.submit(score_records, chunk, batch_size, embedding_mode, mode)
+            )
+            return True
+
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [future for future in in_flight if future in finished]
+                for future in done:
+                    in_flight.remove(future)
+            for future in done:
+                yield from future.result()
+                submit_next()
+
+
+def run_batch(
+    input_path: str,
+    output_path: str,
+    workers: int = 1,
+    batch_size: int = scoring.DEFAULT_BATCH_SIZE,
+    ordered: bool = True,
+    input_format: Optional[str] = None,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    encoder_backend: Optional[str] = None,
+    bucket_batches: int = DEFAULT_BUCKET_BATCHES,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+    feature_store: Optional[str] = None,
+    threads_per_worker: Optional[int] = None,
+) -> int:
+    """
+    Score every record of input_path into output_path (JSONL).
+
+    workers <= 1 scores in this process; otherwise a process pool is used,
+    each worker loading the model once. encoder_backend overrides the
+    configured backend (see encoders); mode="fast" skips the encoder (see
+    scoring.SCORING_MODES); feature_store is the path of a SQLite feature
+    store to read and fill (see feature_store); threads_per_worker caps
+    torch's intra-op threads in each pool worker (default: CPU count /
+    workers). Returns the number of records written.
+    """
+    if encoder_backend is not None:
+        scoring.set_encoder_backend(encoder_backend)
+    records = read_records(input_path, input_format)
+
+    if workers <= 1:
+        if feature_store is not None:
+            scoring.enable_feature_store(feature_store)
+        scoring.warmup(mode)
+        results = iter_scores(records, batch_size, embedding_mode, bucket_batches, mode)
+    else:
+        if threads_per_worker is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        chunks = chunked(records, batch_size * bucket_batches)
+        results = _iter_pool_results(
+            chunks,
+            workers,
+            batch_size,
+            ordered,
+            embedding_mode,
+            mode,
+            feature_store,
+            threads_per_worker,
+        )
+
+    written = 0
+    try:
+        with open(output_path, "w", encoding="utf-8") as out:
+            for row in results:
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                written += 1
+                if written % batch_size == 0:
+                    out.flush()
+    finally:
+        if workers <= 1 and feature_store is not None:
+            scoring.disable_feature_store()
+    return written
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m scoring batch",
+        description="Score a JSONL/CSV file of {id, text, duration_sec} records.",
+    )
+    parser.add_argument("input", help="input .jsonl or .csv file")
+    parser.add_argument("output", help="output .jsonl file")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="worker processes (default: CPU count; 1 = no pool)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=scoring.DEFAULT_BATCH_SIZE,
+        help="records per encoder batch",
+    )
+    parser.add_argument(
+        "--unordered", action="store_true",
+        help="write results as soon as any batch finishes instead of in input order",
+    )
+    parser.add_argument("--input-format", choices=["jsonl", "csv"], default=None)
+    parser.add_argument(
+        "--embedding-mode", choices=scoring.EMBEDDING_MODES,
+        default=scoring.DEFAULT_EMBEDDING_MODE,
+    )
+    parser.add_argument(
+        "--encoder-backend", choices=encoders.ENCODER_BACKENDS, default=None,
+        help=f"encoder backend (default: ${encoders.BACKEND_ENV_VAR} or torch)",
+    )
+    parser.add_argument(
+        "--bucket-batches", type=int, default=DEFAULT_BUCKET_BATCHES,
+        help="encoder batches per length-sorted chunk (1 = no cross-batch sorting)",
+    )
+    parser.add_argument(
+        "--mode", choices=scoring.SCORING_MODES, default=scoring.DEFAULT_SCORING_MODE,
+        help="fast = rubric score only, no semantic similarities",
+    )
+    parser.add_argument(
+        "--feature-store", default=None, metavar="PATH",
+        help="SQLite file of stored features and embeddings to reuse and extend",
+    )
+    parser.add_argument(
+        "--threads-per-worker", type=int, default=None,
+        help="torch intra-op threads per worker (default: CPU count / workers)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.batch_size <= 0 or args.bucket_batches <= 0:
+        print("--batch-size and --bucket-batches must be positive", file=sys.stderr)
+        return 2
+    if args.threads_per_worker is not None and args.threads_per_worker <= 0:
+        print("--threads-per-worker must be positive", file=sys.stderr)
+        return 2
+
+    written = run_batch(
+        args.input,
+        args.output,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        ordered=not args.unordered,
+        input_format=args.input_format,
+        embedding_mode=args.embedding_mode,
+        encoder_backend=args.encoder_backend,
+        bucket_batches=args.bucket_batches,
+        mode=args.mode,
+        feature_store=args.feature_store,
+        threads_per_worker=args.threads_per_worker,
+    )
+    print(f"Scored {written} records -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
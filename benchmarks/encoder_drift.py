@@ -0,0 +1,146 @@
+"""
+Compare an encoder backend against the fp32 reference.
+
+Usage (from the repository root):
+    python -m benchmarks.encoder_drift [--candidate torch-int8]
+        [--reference torch] [--corpus-size 200] [--words 20,200,2000]
+        [--embedding-mode document] [--output drift_results.json]
+
+Scores the same reference corpus (the sample transcript plus synthetic
+transcripts of each size) with both backends and reports, per criterion,
+how far the candidate's semantic similarities drift from the reference
+(mean / p99 / max absolute difference) together with each backend's encode
+throughput, so the accuracy cost of a faster backend can be weighed
+before switching to it.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+import encoders
+import scoring
+from benchmarks.synthetic import generate_corpus
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "Sample text for case study.txt",
+)
+DEFAULT_WORDS = [20, 200, 2000]
+
+
+def reference_corpus(corpus_size: int, words: Sequence[int]) -> List[str]:
+    corpus = []
+    if os.path.exists(SAMPLE_PATH):
+        with open(SAMPLE_PATH, encoding="utf-8") as f:
+            corpus.append(f.read())
+    per_size = max(1, corpus_size // len(words))
+    for size in words:
+        corpus.extend(generate_corpus(per_size, size, seed=size))
+    return corpus
+
+
+def similarities_for(
+    backend: str, corpus: List[str], embedding_mode: str, batch_size: int
+) -> Dict:
+    """
+    Similarity matrix (texts x criteria) and encode throughput for one backend.
+    """
+    scoring.set_encoder_backend(backend)
+    scoring.warmup()
+    # throughput is measured on a second pass so model load is excluded
+    scoring.compute_semantic_similarities_batch(
+        corpus[:batch_size], batch_size=batch_size, embedding_mode=embedding_mode
+    )
+
+    start = time.perf_counter()
+    sims = scoring.compute_semantic_similarities_batch(
+        corpus, batch_size=batch_size, embedding_mode=embedding_mode
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "matrix": np.array([[s[key] for key in scoring.CRITERION_KEYS] for s in sims]),
+        "texts_per_s": len(corpus) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def drift_report(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """
+    Per-criterion absolute-difference statistics between two similarity
+    matrices of shape (texts, len(CRITERION_KEYS)).
+    """
+    diff = np.abs(candidate - reference)
+    report = {}
+    for i, key in enumerate(scoring.CRITERION_KEYS):
+        column = diff[:, i]
+        report[key] = {
+            "mean_abs": float(column.mean()),
+            "p99_abs": float(np.percentile(column, 99)),
+            "max_abs": float(column.max()),
+        }
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reference", choices=encoders.ENCODER_BACKENDS, default="torch")
+    parser.add_argument("--candidate", choices=encoders.ENCODER_BACKENDS, default="torch-int8")
+    parser.add_argument("--corpus-size", type=int, default=200)
+    parser.add_argument(
+        "--words", default=",".join(str(w) for w in DEFAULT_WORDS),
+        help="comma-separated synthetic transcript sizes in words",
+    )
+    parser.add_argument(
+        "--embedding-mode", choices=scoring.EMBEDDING_MODES,
+        default=scoring.DEFAULT_EMBEDDING_MODE,
+    )
+    parser.add_argument("--batch-size", type=int, default=scoring.DEFAULT_BATCH_SIZE)
+    parser.add_argument("--output", default="drift_results.json")
+    args = parser.parse_args(argv)
+
+    corpus = reference_corpus(args.corpus_size, [int(w) for w in args.words.split(",")])
+    ref = similarities_for(args.reference, corpus, args.embedding_mode, args.batch_size)
+    cand = similarities_for(args.candidate, corpus, args.embedding_mode, args.batch_size)
+    drift = drift_report(ref["matrix"], cand["matrix"])
+
+    report = {
+        "meta": {
+            "model": scoring.SEM_MODEL_NAME,
+            "reference": args.reference,
+            "candidate": args.candidate,
+            "embedding_mode": args.embedding_mode,
+            "texts": len(corpus),
+            "mean_words": statistics.fmean(len(t.split()) for t in corpus),
+        },
+        "throughput_texts_per_s": {
+            args.reference: ref["texts_per_s"],
+            args.candidate: cand["texts_per_s"],
+        },
+        "drift": drift,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{args.candidate} vs {args.reference} on {len(corpus)} texts")
+    print(f"{'criterion':12s} {'mean |d|':>10s} {'p99 |d|':>10s} {'max |d|':>10s}")
+    for key, stats in drift.items():
+        print(
+            f"{key:12s} {stats['mean_abs']:10.5f} {stats['p99_abs']:10.5f} "
+            f"{stats['max_abs']:10.5f}"
+        )
+    speedup = cand["texts_per_s"] / ref["texts_per_s"] if ref["texts_per_s"] else 0.0
+    print(
+        f"throughput: {ref['texts_per_s']:.1f} -> {cand['texts_per_s']:.1f} texts/s "
+        f"({speedup:.2f}x)"
+    )
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
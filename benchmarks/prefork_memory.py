@@ -0,0 +1,121 @@
+"""
+Measure per-worker memory of the pre-fork server under load.
+
+Usage (from the repository root):
+    python -m benchmarks.prefork_memory [--workers 4] [--requests 200]
+        [--concurrency 8] [--port 8765] [--output prefork_memory.json]
+
+Starts prefork.py, sends synthetic transcripts to POST /score so every
+worker has run real encodes, then reads RSS / PSS / USS of the master and
+of each worker from /proc. With copy-on-write sharing working, a worker's
+USS (memory only it holds) is a small fraction of its RSS, and the PSS
+total of the whole group is far below `workers x` the RSS of one
+standalone process.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from benchmarks.synthetic import generate_corpus
+from prefork import memory_report
+
+
+def _children(pid: int) -> List[int]:
+    with open(f"/proc/{pid}/task/{pid}/children", encoding="ascii") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def _wait_healthy(url: str, server: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"prefork.py exited with status {server.returncode}")
+        try:
+            with urllib.request.urlopen(url + "/health", timeout=1):
+                return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become healthy")
+
+
+def _post(url: str, text: str) -> None:
+    body = json.dumps({"text": text, "duration_sec": 60.0}).encode("utf-8")
+    request = urllib.request.Request(
+        url + "/score", data=body, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    parser.add_argument("--output", default="prefork_memory.json")
+    args = parser.parse_args(argv)
+
+    url = f"http://127.0.0.1:{args.port}"
+    master = subprocess.Popen(
+        [
+            sys.executable, "prefork.py",
+            "--workers", str(args.workers),
+            "--port", str(args.port),
+            "--quiet",
+        ]
+    )
+    try:
+        _wait_healthy(url, master, args.startup_timeout)
+        corpus = generate_corpus(args.requests, args.words, seed=0)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            list(pool.map(lambda text: _post(url, text), corpus))
+        elapsed = time.perf_counter() - start
+
+        workers = _children(master.pid)
+        master_mem = memory_report([master.pid])[0]
+        worker_mem = memory_report(workers)
+    finally:
+        master.terminate()
+        master.wait()
+
+    total_pss = master_mem["pss_kb"] + sum(w["pss_kb"] for w in worker_mem)
+    report = {
+        "workers": len(worker_mem),
+        "requests": args.requests,
+        "requests_per_s": args.requests / elapsed if elapsed > 0 else 0.0,
+        "master": master_mem,
+        "worker_processes": worker_mem,
+        "total_pss_kb": total_pss,
+        # what the same number of independently loaded processes would take
+        "unshared_estimate_kb": master_mem["rss_kb"] * (len(worker_mem) + 1),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    mb = 1024.0
+    print(f"master rss {master_mem['rss_kb'] / mb:.1f} MB")
+    for w in worker_mem:
+        print(
+            f"worker {w['pid']}: rss {w['rss_kb'] / mb:.1f} MB, "
+            f"uss {w['uss_kb'] / mb:.1f} MB, pss {w['pss_kb'] / mb:.1f} MB"
+        )
+    print(
+        f"total pss {total_pss / mb:.1f} MB vs ~{report['unshared_estimate_kb'] / mb:.1f} MB "
+        f"for {len(worker_mem) + 1} independent processes"
+    )
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Benchmark score_transcript and each score_* stage on synthetic transcripts.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks [--sizes 20,200,2000,20000]
+        [--repeat 20] [--max-seconds 5] [--output bench_results.json]
+        [--compare previous_results.json] [--skip-semantic]
+
+For every (function, transcript size) pair it records latency percentiles,
+throughput and peak Python heap allocation (tracemalloc, measured in a
+separate pass so it does not distort the timings), and writes everything to
+a JSON file that later runs can be compared against with --compare.
+"""
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import scoring
+from benchmarks.synthetic import generate_corpus
+from text_utils import TranscriptAnalysis, preprocess_text
+
+DEFAULT_SIZES = [20, 200, 2000, 20000]
+CORPUS_SIZE = 8
+DURATION_SEC = 60.0
+
+
+def _prepare(text: str) -> Dict:
+    """
+    The inputs each stage receives inside score_transcript.
+    """
+    clean = preprocess_text(text)
+    stats = TranscriptAnalysis(text).stats
+    return {
+        "text": text,
+        "clean": clean,
+        "sentences": stats["sentences"],
+        "tags": TranscriptAnalysis(text).phrases[1],
+        "total_words": stats["total_words"],
+        "distinct_words": stats["distinct_words"],
+    }
+
+
+# name -> (needs the encoder, callable taking one prepared input)
+BENCHMARKS: Dict[str, tuple] = {
+    "score_transcript": (True, lambda p: scoring.score_transcript(p["text"], DURATION_SEC)),
+    "score_transcript_fast": (
+        False, lambda p: scoring.score_transcript(p["text"], DURATION_SEC, mode="fast")
+    ),
+    "score_rules": (False, lambda p: scoring.score_rules(p["text"], DURATION_SEC)),
+    "score_salutation": (False, lambda p: scoring.score_salutation(p["clean"])),
+    "score_keywords": (False, lambda p: scoring.score_keywords(p["clean"])),
+    "score_flow": (False, lambda p: scoring.score_flow(p["sentences"], p["tags"])),
+    "score_speech_rate": (
+        False, lambda p: scoring.score_speech_rate(p["total_words"], DURATION_SEC)
+    ),
+    "score_grammar": (False, lambda p: scoring.score_grammar(p["text"], p["total_words"])),
+    "score_vocabulary": (
+        False, lambda p: scoring.score_vocabulary(p["total_words"], p["distinct_words"])
+    ),
+    "score_clarity": (False, lambda p: scoring.score_clarity(p["clean"], p["total_words"])),
+    "score_engagement": (False, lambda p: scoring.score_engagement(p["text"])),
+    "compute_semantic_similarities": (
+        True, lambda p: scoring.compute_semantic_similarities(p["clean"])
+    ),
+}
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def measure(
+    fn: Callable[[Dict], object],
+    inputs: Sequence[Dict],
+    repeat: int,
+    max_seconds: float,
+) -> Dict:
+    # warm-up (lazy model / lexicon loading is not part of the measurement)
+    fn(inputs[0])
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(repeat * len(inputs)):
+        t0 = time.perf_counter()
+        fn(inputs[i % len(inputs)])
+        latencies.append(time.perf_counter() - t0)
+        if time.perf_counter() - started > max_seconds and len(latencies) >= 3:
+            break
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    fn(inputs[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "mean_ms": statistics.fmean(latencies) * 1000.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000.0,
+        "p90_ms": _percentile(latencies, 0.90) * 1000.0,
+        "p99_ms": _percentile(latencies, 0.99) * 1000.0,
+        "max_ms": latencies[-1] * 1000.0,
+        "throughput_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "peak_alloc_kb": peak / 1024.0,
+    }
+
+
+def run(
+    sizes: Sequence[int],
+    repeat: int,
+    max_seconds: float,
+    functions: Optional[Sequence[str]] = None,
+    skip_semantic: bool = False,
+) -> Dict:
+    names = list(functions or BENCHMARKS)
+    results = []
+    for size in sizes:
+        inputs = [_prepare(text) for text in generate_corpus(CORPUS_SIZE, size, seed=size)]
+        words = statistics.fmean(p["total_words"] for p in inputs)
+        for name in names:
+            needs_model, fn = BENCHMARKS[name]
+            if needs_model and skip_semantic:
+                continue
+            row = {"function": name, "target_words": size, "mean_words": words}
+            row.update(measure(fn, inputs, repeat, max_seconds))
+            results.append(row)
+            print(
+                f"{name:32s} {size:>6d} words  p50 {row['p50_ms']:9.3f} ms  "
+                f"p99 {row['p99_ms']:9.3f} ms  {row['throughput_per_s']:10.1f}/s",
+                file=sys.stderr,
+            )
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "model": scoring.SEM_MODEL_NAME,
+            "rubric_version": scoring.RUBRIC_VERSION,
+            "repeat": repeat,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> None:
+    """
+    Print p50 latency ratios (current / baseline) for matching rows.
+    """
+    base = {(r["function"], r["target_words"]): r for r in baseline["results"]}
+    print(f"{'function':32s} {'words':>6s} {'p50 base':>10s} {'p50 now':>10s} {'ratio':>7s}")
+    for row in current["results"]:
+        old = base.get((row["function"], row["target_words"]))
+        if old is None or not old["p50_ms"]:
+            continue
+        print(
+            f"{row['function']:32s} {row['target_words']:>6d} "
+            f"{old['p50_ms']:10.3f} {row['p50_ms']:10.3f} {row['p50_ms'] / old['p50_ms']:7.2f}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="comma-separated transcript sizes in words",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the corpus per case")
+    parser.add_argument(
+        "--max-seconds", type=float, default=5.0, help="time budget per (function, size) case"
+    )
+    parser.add_argument(
+        "--functions", default=None,
+        help=f"comma-separated subset of: {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument("--skip-semantic", action="store_true", help="skip encoder benchmarks")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="previous results file to compare with")
+    args = parser.parse_args(argv)
+
+    functions = args.functions.split(",") if args.functions else None
+    unknown = [f for f in functions or [] if f not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown function(s): {', '.join(unknown)}")
+
+    report = run(
+        [int(s) for s in args.sizes.split(",")],
+        args.repeat,
+        args.max_seconds,
+        functions=functions,
+        skip_semantic=args.skip_semantic,
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Synthetic self-introduction transcripts for benchmarking.
+
+Sentences are assembled from the phrase tables in text_utils (salutations,
+rubric concepts, closings) plus filler words and neutral padding, so the
+generated text exercises the same code paths as real transcripts.
+"""
+import random
+from typing import List, Optional
+
+from text_utils import CLOSING_PHRASES, CONCEPT_PHRASES, SALUTATION_LEVEL_PHRASES
+
+FILLERS = ["um", "uh", "like", "you know", "so", "actually", "basically", "well"]
+
+# Words used to complete a phrase into a plausible sentence
+COMPLETIONS = [
+    "playing cricket with my friends",
+    "reading stories in the evening",
+    "a doctor when I grow up",
+    "Delhi with my family",
+    "Sunrise Public School",
+    "my younger sister and my parents",
+    "painting and singing",
+    "the district chess competition",
+    "very kind and helpful",
+    "mathematics and science",
+]
+
+PADDING = [
+    "I think it is important to work hard every day.",
+    "Sometimes I help my friends with their homework.",
+    "We go to the park on weekends.",
+    "I also like to watch documentaries about animals.",
+    "Last year we went on a trip to the mountains.",
+]
+
+
+def _sentence(rng: random.Random, phrase: str) -> str:
+    words = [phrase.strip(), rng.choice(COMPLETIONS)]
+    if rng.random() < 0.3:
+        words.insert(0, rng.choice(FILLERS))
+    text = " ".join(words)
+    return text[0].upper() + text[1:] + "."
+
+
+def generate_transcript(num_words: int, seed: Optional[int] = None) -> str:
+    """
+    Return a transcript of roughly `num_words` words (never fewer): a
+    salutation, concept sentences and padding until the length is reached,
+    then a closing line.
+    """
+    rng = random.Random(seed)
+    level = rng.choice(sorted(SALUTATION_LEVEL_PHRASES))
+    opening = rng.choice(SALUTATION_LEVEL_PHRASES[level])
+    closing = rng.choice(CLOSING_PHRASES)
+
+    sentences = [opening[0].upper() + opening[1:] + "."]
+    closing_sentence = closing[0].upper() + closing[1:] + "."
+    count = len(sentences[0].split()) + len(closing_sentence.split())
+
+    concept_phrases = [p for phrases in CONCEPT_PHRASES.values() for p in phrases]
+    while count < num_words:
+        if rng.random() < 0.7:
+            sentence = _sentence(rng, rng.choice(concept_phrases))
+        else:
+            sentence = rng.choice(PADDING)
+        sentences.append(sentence)
+        count += len(sentence.split())
+
+    sentences.append(closing_sentence)
+    return " ".join(sentences)
+
+
+def generate_corpus(num_transcripts: int, num_words: int, seed: int = 0) -> List[str]:
+    return [generate_transcript(num_words, seed=seed + i) for i in range(num_transcripts)]
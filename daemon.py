@@ -0,0 +1,206 @@
+"""
+Local scoring daemon on a Unix domain socket.
+
+Usage:
+    python daemon.py [--socket PATH] [--window-ms 0] [--max-batch 32]
+                     [--encode-batch-size 8] [--encoder-backend BACKEND]
+
+Keeps one warmed scorer (VADER, sentence encoder, criterion embeddings) in
+memory so short-lived scripts and cron jobs do not each pay the torch and
+MiniLM startup: they call scorer_client.score_transcript, which has the
+same signature as scoring.score_transcript, and get the result back over
+the socket in milliseconds. See scorer_client for the length-prefixed JSON
+wire format; the default socket is scorer_client.default_socket_path().
+
+Each connection gets its own thread and may send any number of requests.
+Encodes from concurrent connections are coalesced through the same
+MicroBatcher as the HTTP service. Its window defaults to 0 here: callers are
+mostly one script at a time, which should not wait for company, while
+requests that queue up behind a running encode are still batched together.
+"""
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+from typing import Dict, Optional, Sequence
+
+import encoders
+import scoring
+from scorer_client import default_socket_path, recv_frame, send_frame
+from service import (
+    DEFAULT_ENCODE_BATCH_SIZE,
+    DEFAULT_MAX_BATCH,
+    MicroBatcher,
+    parse_duration,
+    score_with_batcher,
+)
+
+DEFAULT_WINDOW_MS = 0.0
+
+
+def _score_request(batcher: MicroBatcher, request: Dict) -> Dict:
+    try:
+        text = request["text"]
+        duration_sec = parse_duration(request["duration_sec"])
+    except KeyError as exc:
+        raise ValueError(f"missing field {exc}") from None
+    if not isinstance(text, str):
+        raise ValueError("text must be a string")
+    embedding_mode = request.get("embedding_mode", scoring.DEFAULT_EMBEDDING_MODE)
+    if embedding_mode not in scoring.EMBEDDING_MODES:
+        raise ValueError(f"embedding_mode must be one of {scoring.EMBEDDING_MODES}")
+    mode = scoring.check_scoring_mode(request.get("mode", scoring.DEFAULT_SCORING_MODE))
+
+    if request.get("timings") or request.get("parallel"):
+        # per-call options the shared batcher does not carry
+        return scoring.score_transcript(
+            text,
+            duration_sec,
+            embedding_mode=embedding_mode,
+            parallel=bool(request.get("parallel")),
+            timings=bool(request.get("timings")),
+            mode=mode,
+        )
+    return score_with_batcher(batcher, text, duration_sec, embedding_mode, mode)
+
+
+class ScoringDaemonHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                request = recv_frame(self.request)
+            except (ValueError, ConnectionError, OSError):
+                return
+            if request is None:
+                return
+
+            try:
+                op = request.get("op")
+                if op == "ping":
+                    reply = {"ok": True, "result": "pong"}
+                elif op == "score":
+                    reply = {"ok": True, "result": _score_request(self.server.batcher, request)}
+                else:
+                    raise ValueError(f"unknown op {op!r}")
+            except Exception as exc:
+                reply = {"ok": False, "error": str(exc), "type": type(exc).__name__}
+
+            try:
+                try:
+                    send_frame(self.request, reply)
+                except ValueError:
+                    # NaN/Infinity in the result, e.g. from a subnormal duration
+                    send_frame(
+                        self.request,
+                        {"ok": False, "error": "duration_sec too small", "type": "ValueError"},
+                    )
+            except OSError:
+                return
+
+
+class ScoringDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, socket_path: str, batcher: MicroBatcher):
+        _remove_stale_socket(socket_path)
+        # the socket file is created with the umask; keep it private to this user
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, ScoringDaemonHandler)
+        finally:
+            os.umask(old_umask)
+        self.socket_path = socket_path
+        self.batcher = batcher
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Delete a socket file left behind by a daemon that is no longer running;
+    refuse to start next to a live one, or on a path that is not a socket.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise RuntimeError(f"{path} exists and is not a socket")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        # nobody is accepting on it: left over from a daemon that died
+        os.unlink(path)
+    except OSError as exc:
+        raise RuntimeError(f"cannot probe existing socket {path}: {exc}") from None
+    else:
+        raise RuntimeError(f"a scoring daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+def _interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Scoring daemon on a Unix domain socket.")
+    parser.add_argument(
+        "--socket", default=None,
+        help="socket path (default: $SCORER_SOCKET or a per-user path in the runtime dir)",
+    )
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--encode-batch-size", type=int, default=DEFAULT_ENCODE_BATCH_SIZE)
+    parser.add_argument(
+        "--encoder-backend", choices=encoders.ENCODER_BACKENDS, default=None,
+        help=f"encoder backend (default: ${encoders.BACKEND_ENV_VAR} or torch)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    socket_path = args.socket or default_socket_path()
+
+    if args.encoder_backend is not None:
+        scoring.set_encoder_backend(args.encoder_backend)
+    scoring.warmup()
+    batcher = MicroBatcher(
+        window_ms=args.window_ms,
+        max_batch=args.max_batch,
+        encode_batch_size=args.encode_batch_size,
+    )
+    try:
+        server = ScoringDaemon(socket_path, batcher)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        batcher.close()
+        return 1
+
+    # stop cleanly (and remove the socket file) on SIGTERM too
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"Scoring daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import re
+import tempfile
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# Bump when the on-disk layout or the way vectors are produced changes,
+# so stale files from an older layout are simply never looked up again.
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "ai_communication_scorer"
+)
+
+
+def get_cache_dir() -> str:
+    """
+    Root directory for cached embeddings (override with SCORER_CACHE_DIR).
+    """
+    return os.environ.get("SCORER_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def _model_slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+
+
+def description_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_path(model_name: str, text: str) -> str:
+    """
+    Path of the cached vector for one description:
+    <cache_dir>/criterion_embeddings/v<version>/<model>/<sha256(text)>.npy
+    """
+    return os.path.join(
+        get_cache_dir(),
+        "criterion_embeddings",
+        f"v{CACHE_VERSION}",
+        _model_slug(model_name),
+        description_hash(text) + ".npy",
+    )
+
+
+def _save_atomic(path: str, vector: np.ndarray) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, vector)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_or_encode(
+    descriptions: Dict[str, str],
+    model_name: str,
+    encode: Callable[[List[str]], np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """
+    Return {key: vector} for every description.
+
+    Vectors already cached for (model_name, description text) are loaded
+    memory-mapped; only the descriptions with no cached file are passed to
+    `encode` (in one call) and then written to the cache. If the cache
+    directory is not writable the freshly encoded vectors are returned
+    as-is.
+    """
+    vectors = {}
+    missing_keys = []
+
+    for key, text in descriptions.items():
+        try:
+            vectors[key] = np.load(cache_path(model_name, text), mmap_mode="r")
+        except (OSError, ValueError, EOFError):
+            # missing, or an empty/corrupt file: re-encode and overwrite it
+            missing_keys.append(key)
+
+    if missing_keys:
+        encoded = encode([descriptions[key] for key in missing_keys])
+        for key, vector in zip(missing_keys, encoded):
+            vector = np.asarray(vector, dtype=np.float32)
+            try:
+                _save_atomic(cache_path(model_name, descriptions[key]), vector)
+            except OSError:
+                pass
+            vectors[key] = vector
+
+    return vectors
@@ -0,0 +1,225 @@
+"""
+Sentence-encoder backends.
+
+Every backend returns an object with SentenceTransformer's
+encode(texts, batch_size=..., convert_to_numpy=True, normalize_embeddings=True)
+signature, so scoring.py does not care which one is loaded:
+
+    torch       SentenceTransformer in fp32 (default)
+    torch-int8  the same model with dynamic int8 quantization applied to
+                every nn.Linear (CPU only; weights are quantized once at
+                load time, activations per batch)
+    onnx        the ONNX export of the model on onnxruntime (CPU), with
+                mean pooling and normalisation done in numpy; torch is
+                never imported
+
+The backend is picked with the SCORER_ENCODER_BACKEND environment variable
+or scoring.set_encoder_backend(). The onnx backend reads the model from
+$SCORER_ONNX_MODEL_DIR (a directory holding tokenizer.json and the .onnx
+file), downloading the model repository's ONNX export from the Hugging Face
+Hub when it is unset. $SCORER_ONNX_MODEL_FILE selects the file inside it
+(default onnx/model.onnx; the repo also ships int8 exports such as
+onnx/model_qint8_avx512.onnx). Embeddings from different backends are not
+interchangeable, so model_key() gives each one its own cache namespace.
+Use benchmarks/encoder_drift.py to see how far a backend's similarities move
+from the fp32 reference before switching to it.
+"""
+import json
+import os
+from typing import List, Tuple
+
+import numpy as np
+
+ENCODER_BACKENDS = ("torch", "torch-int8", "onnx")
+DEFAULT_ENCODER_BACKEND = "torch"
+BACKEND_ENV_VAR = "SCORER_ENCODER_BACKEND"
+
+ONNX_MODEL_DIR_ENV_VAR = "SCORER_ONNX_MODEL_DIR"
+ONNX_MODEL_FILE_ENV_VAR = "SCORER_ONNX_MODEL_FILE"
+DEFAULT_ONNX_MODEL_FILE = "onnx/model.onnx"
+# all-MiniLM-L6-v2's max_seq_length, used when the model directory has no
+# sentence_bert_config.json
+DEFAULT_MAX_SEQ_LENGTH = 256
+
+
+def check_backend(backend: str) -> str:
+    if backend not in ENCODER_BACKENDS:
+        raise ValueError(
+            f"unknown encoder backend {backend!r}; expected one of {ENCODER_BACKENDS}"
+        )
+    return backend
+
+
+def configured_backend() -> str:
+    """
+    Backend named by $SCORER_ENCODER_BACKEND, or the default.
+    """
+    return check_backend(os.environ.get(BACKEND_ENV_VAR) or DEFAULT_ENCODER_BACKEND)
+
+
+def model_key(model_name: str, backend: str) -> str:
+    """
+    Identifier for embeddings produced by `model_name` on `backend`, used in
+    embedding and result cache keys. The fp32 backend keeps the bare model
+    name so existing caches stay valid.
+    """
+    if backend == DEFAULT_ENCODER_BACKEND:
+        return model_name
+    if backend == "onnx":
+        model_file = onnx_model_file()
+        if model_file != DEFAULT_ONNX_MODEL_FILE:
+            return f"{model_name}+onnx:{os.path.splitext(os.path.basename(model_file))[0]}"
+    return f"{model_name}+{backend}"
+
+
+def onnx_model_file() -> str:
+    return os.environ.get(ONNX_MODEL_FILE_ENV_VAR) or DEFAULT_ONNX_MODEL_FILE
+
+
+def _load_torch(model_name: str):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def _load_torch_int8(model_name: str):
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    # Quantized kernels are CPU-only.
+    model = SentenceTransformer(model_name, device="cpu")
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+class OnnxEncoder:
+    """
+    SentenceTransformer-compatible encoder running a transformer ONNX export
+    on onnxruntime: tokenise with `tokenizers`, run the model, mean-pool the
+    token embeddings over the attention mask and L2-normalise, as the
+    all-MiniLM-L6-v2 Pooling + Normalize modules do.
+    """
+
+    def __init__(self, model_path: str, tokenizer_path: str, max_seq_length: int):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self.session = onnxruntime.InferenceSession(
+            model_path, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_seq_length)
+        self.tokenizer.enable_padding()
+        # untruncated copy, for token_offsets()
+        self._offsets_tokenizer = Tokenizer.from_file(tokenizer_path)
+        self._offsets_tokenizer.no_truncation()
+        self._offsets_tokenizer.no_padding()
+        self.max_seq_length = max_seq_length
+
+    def token_offsets(self, text: str) -> List[Tuple[int, int]]:
+        return self._offsets_tokenizer.encode(text, add_special_tokens=False).offsets
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        mask = attention_mask[:, :, None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return (summed / counts).astype(np.float32)
+
+    def encode(
+        self,
+        texts,
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        **kwargs,
+    ) -> np.ndarray:
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        embeddings = np.concatenate(
+            [
+                self._encode_batch(list(texts[start:start + batch_size]))
+                for start in range(0, len(texts), batch_size)
+            ]
+        )
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+def token_offsets(encoder, text: str) -> List[Tuple[int, int]]:
+    """
+    (start, end) character offsets of every token of `text` under the
+    encoder's tokenizer, without special tokens and without truncation.
+    """
+    if isinstance(encoder, OnnxEncoder):
+        return encoder.token_offsets(text)
+    return encoder.tokenizer(
+        text,
+        add_special_tokens=False,
+        return_offsets_mapping=True,
+        truncation=False,
+        verbose=False,
+    )["offset_mapping"]
+
+
+def _onnx_model_dir(model_name: str, model_file: str) -> str:
+    model_dir = os.environ.get(ONNX_MODEL_DIR_ENV_VAR)
+    if model_dir:
+        return model_dir
+    if os.path.isdir(model_name):
+        return model_name
+
+    from huggingface_hub import snapshot_download
+
+    repo_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+    return snapshot_download(
+        repo_id,
+        allow_patterns=[model_file, "tokenizer.json", "sentence_bert_config.json"],
+    )
+
+
+def _load_onnx(model_name: str) -> OnnxEncoder:
+    model_file = onnx_model_file()
+    model_dir = _onnx_model_dir(model_name, model_file)
+
+    max_seq_length = DEFAULT_MAX_SEQ_LENGTH
+    config_path = os.path.join(model_dir, "sentence_bert_config.json")
+    if os.path.exists(config_path):
+        with open(config_path, encoding="utf-8") as f:
+            max_seq_length = json.load(f).get("max_seq_length") or max_seq_length
+
+    return OnnxEncoder(
+        os.path.join(model_dir, model_file),
+        os.path.join(model_dir, "tokenizer.json"),
+        max_seq_length,
+    )
+
+
+_LOADERS = {
+    "torch": _load_torch,
+    "torch-int8": _load_torch_int8,
+    "onnx": _load_onnx,
+}
+
+
+def load_encoder(model_name: str, backend: str = DEFAULT_ENCODER_BACKEND):
+    """
+    Build the encoder for `model_name` on `backend`.
+    """
+    return _LOADERS[check_backend(backend)](model_name)
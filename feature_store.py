@@ -0,0 +1,202 @@
+"""
+Persistent per-transcript feature store (SQLite).
+
+Rows are keyed by text_hash(raw transcript text) and hold what scoring
+extracts from the text (scoring.extract_features: counts, tokens, concept
+flags, structure tags, grammar error rate, filler count, VADER pos) plus
+the document embedding per encoder and embedding mode, stored as a
+float16 blob (768 bytes for MiniLM's 384 dimensions).
+
+With a store enabled (scoring.enable_feature_store) scoring looks features
+and embeddings up before computing them, so re-scoring a transcript after a
+band or weight change is a lookup rather than a pass over the text and the
+encoder. Features are tagged with the extraction version they were built
+with; rows from another version are ignored and overwritten.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    text_hash TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    total_words INTEGER NOT NULL,
+    distinct_words INTEGER NOT NULL,
+    sentence_count INTEGER NOT NULL,
+    tokens BLOB NOT NULL,
+    concepts TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    salutation_score INTEGER NOT NULL,
+    errors_per_100 REAL NOT NULL,
+    filler_count INTEGER NOT NULL,
+    pos REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    text_hash TEXT NOT NULL,
+    model_key TEXT NOT NULL,
+    embedding_mode TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (text_hash, model_key, embedding_mode)
+);
+"""
+
+_FEATURE_COLUMNS = (
+    "total_words",
+    "distinct_words",
+    "sentence_count",
+    "tokens",
+    "concepts",
+    "tags",
+    "salutation_score",
+    "errors_per_100",
+    "filler_count",
+    "pos",
+)
+
+# SQLite's default limit on host parameters per statement is 999
+_LOOKUP_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def pack_embedding(vector: np.ndarray) -> bytes:
+    return np.asarray(vector, dtype=np.float16).tobytes()
+
+
+def unpack_embedding(blob: bytes) -> np.ndarray:
+    """
+    float32 vector from a float16 blob, re-normalised to unit length.
+    """
+    vector = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def _feature_row(features: Dict) -> Tuple:
+    return (
+        features["total_words"],
+        features["distinct_words"],
+        features["sentence_count"],
+        zlib.compress(json.dumps(features["tokens"]).encode("utf-8")),
+        json.dumps(features["concepts"]),
+        json.dumps(features["tags"]),
+        features["salutation_score"],
+        features["errors_per_100"],
+        features["filler_count"],
+        features["pos"],
+    )
+
+
+def _row_features(row: Sequence) -> Dict:
+    features = dict(zip(_FEATURE_COLUMNS, row))
+    features["tokens"] = json.loads(zlib.decompress(features["tokens"]))
+    features["concepts"] = json.loads(features["concepts"])
+    features["tags"] = json.loads(features["tags"])
+    return features
+
+
+def _chunks(items: List, size: int = _LOOKUP_CHUNK) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class FeatureStore:
+    """
+    SQLite file of features and embeddings; safe to share between threads,
+    and between processes (WAL journal, writers wait for each other).
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    # --- features ---------------------------------------------------------
+    def get_features(self, hashes: Sequence[str], version: str) -> Dict[str, Dict]:
+        """
+        {text_hash: features} for the hashes stored under `version`.
+        """
+        found = {}
+        columns = ", ".join(_FEATURE_COLUMNS)
+        with self._lock:
+            for chunk in _chunks(list(set(hashes))):
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, {columns} FROM features "
+                    f"WHERE version = ? AND text_hash IN ({placeholders})",
+                    (version, *chunk),
+                )
+                for row in rows:
+                    found[row[0]] = _row_features(row[1:])
+        return found
+
+    def put_features(self, items: Dict[str, Dict], version: str) -> None:
+        columns = ", ".join(_FEATURE_COLUMNS)
+        placeholders = ", ".join("?" * (len(_FEATURE_COLUMNS) + 2))
+        rows = [(h, version, *_feature_row(f)) for h, f in items.items()]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO features (text_hash, version, {columns}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            self._conn.commit()
+
+    # --- embeddings -------------------------------------------------------
+    def get_embeddings(
+        self, hashes: Sequence[str], model_key: str, embedding_mode: str
+    ) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for chunk in _chunks(list(set(hashes))):
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    "WHERE model_key = ? AND embedding_mode = ? "
+                    f"AND text_hash IN ({placeholders})",
+                    (model_key, embedding_mode, *chunk),
+                )
+                for h, blob in rows:
+                    found[h] = unpack_embedding(blob)
+        return found
+
+    def put_embeddings(
+        self, items: Dict[str, np.ndarray], model_key: str, embedding_mode: str
+    ) -> Dict[str, np.ndarray]:
+        """
+        Store vectors; returns them as they will read back (float16-rounded),
+        so a freshly encoded transcript scores exactly like a stored one.
+        """
+        blobs = {h: pack_embedding(v) for h, v in items.items()}
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(text_hash, model_key, embedding_mode, vector) VALUES (?, ?, ?, ?)",
+                [(h, model_key, embedding_mode, blob) for h, blob in blobs.items()],
+            )
+            self._conn.commit()
+        return {h: unpack_embedding(blob) for h, blob in blobs.items()}
+
+    # --- housekeeping -----------------------------------------------------
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            features = self._conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+            embeddings = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {"features": features, "embeddings": embeddings}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
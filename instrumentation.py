@@ -0,0 +1,103 @@
+import time
+from typing import Callable, Dict, Optional
+
+# Called as sink(timings) after every instrumented score_transcript call,
+# with the same dict that timings=True puts under result["timings"].
+MetricsSink = Callable[[Dict], None]
+
+_metrics_sink: Optional[MetricsSink] = None
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Install (or with None, remove) a process-wide metrics sink. While one is
+    installed every score_transcript call is timed, even without timings=True.
+    """
+    global _metrics_sink
+    _metrics_sink = sink
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    return _metrics_sink
+
+
+class _Stage:
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        stages = self.timer.stages
+        stages[self.name] = stages.get(self.name, 0.0) + elapsed
+
+
+class StageTimer:
+    """
+    Records wall time per named stage:
+
+        with timer.stage("grammar"):
+            ...
+
+    Repeated stages accumulate. as_dict() reports milliseconds.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+        self.info = {}
+        self._start = time.perf_counter()
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self, name)
+
+    def merge(self, other: "StageTimer") -> None:
+        """
+        Add the stages of `other` to this timer's. Stage updates are not
+        locked, so work on another thread records into its own timer and
+        is merged once that thread is done.
+        """
+        for name, secs in other.stages.items():
+            self.stages[name] = self.stages.get(name, 0.0) + secs
+
+    def as_dict(self) -> Dict:
+        return {
+            "stages_ms": {name: secs * 1000.0 for name, secs in self.stages.items()},
+            "total_ms": (time.perf_counter() - self._start) * 1000.0,
+            **self.info,
+        }
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class NullTimer:
+    """
+    Stand-in used when instrumentation is off: every stage is a shared no-op
+    context manager, so the disabled cost is one method call per stage.
+    """
+
+    enabled = False
+    _stage = _NullStage()
+
+    def stage(self, name: str) -> _NullStage:
+        return self._stage
+
+    def merge(self, other) -> None:
+        pass
+
+
+NULL_TIMER = NullTimer()
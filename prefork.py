@@ -0,0 +1,219 @@
+"""
+Pre-fork scoring server.
+
+Usage:
+    python prefork.py [--workers N] [--threads-per-worker N]
+                      [service.py options: --host, --port, --window-ms, ...]
+
+The master process imports scoring, loads the VADER analyzer, the sentence
+encoder and the criterion embeddings, binds the listening socket and only
+then forks N workers, which all accept() on that socket and serve the same
+API as service.py. Model weights are only ever read after loading, so the
+workers share the master's copy of them copy-on-write instead of each
+loading their own; a worker's private memory is just what it writes (its
+request state, plus pages touched by reference-count updates).
+
+The master restarts workers that die. Send it SIGUSR1 to print every
+worker's RSS, PSS and USS (unique set size: memory no other process
+shares) from /proc/<pid>/smaps_rollup; benchmarks/prefork_memory.py
+measures the same under load.
+"""
+import gc
+import os
+import signal
+import sys
+import traceback
+from typing import Dict, List, Optional, Sequence
+
+import scoring
+from service import MicroBatcher, ScoringHTTPServer, build_parser as build_service_parser
+
+# /proc/<pid>/smaps_rollup fields (kB) summed into each memory figure
+_MEMORY_FIELDS = {
+    "rss_kb": ("Rss",),
+    "pss_kb": ("Pss",),
+    "uss_kb": ("Private_Clean", "Private_Dirty"),
+    "shared_kb": ("Shared_Clean", "Shared_Dirty"),
+}
+
+
+def process_memory(pid: int) -> Dict[str, int]:
+    """
+    RSS / PSS / USS / shared memory of one process, in kB (Linux only).
+    """
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            parts = rest.split()
+            if len(parts) == 2 and parts[1] == "kB":
+                values[name] = int(parts[0])
+    return {
+        key: sum(values.get(field, 0) for field in fields)
+        for key, fields in _MEMORY_FIELDS.items()
+    }
+
+
+def memory_report(pids: Sequence[int]) -> List[Dict]:
+    report = []
+    for pid in pids:
+        try:
+            report.append({"pid": pid, **process_memory(pid)})
+        except OSError:
+            pass
+    return report
+
+
+def _print_memory_report(master_pid: int, worker_pids: Sequence[int]) -> None:
+    print(
+        f"{'pid':>8s} {'role':6s} {'rss MB':>9s} {'pss MB':>9s} {'uss MB':>9s}",
+        file=sys.stderr,
+    )
+    for row in memory_report([master_pid, *worker_pids]):
+        role = "master" if row["pid"] == master_pid else "worker"
+        print(
+            f"{row['pid']:>8d} {role:6s} {row['rss_kb'] / 1024:9.1f} "
+            f"{row['pss_kb'] / 1024:9.1f} {row['uss_kb'] / 1024:9.1f}",
+            file=sys.stderr,
+        )
+
+
+class _Shutdown(Exception):
+    pass
+
+
+def _raise_shutdown(signum, frame) -> None:
+    raise _Shutdown()
+
+
+def _run_worker(server: ScoringHTTPServer, args) -> None:
+    """
+    Body of a forked worker; never returns.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+    # Ctrl-C reaches the whole process group; the master shuts workers down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if "torch" in sys.modules:
+        import torch
+
+        # N workers each running a full-width intra-op pool would oversubscribe
+        # the CPU; this also gives every worker a fresh pool after the fork.
+        torch.set_num_threads(args.threads_per_worker)
+
+    status = 0
+    try:
+        # threads do not survive fork(), so the batcher is started here
+        server.batcher = MicroBatcher(
+            window_ms=args.window_ms,
+            max_batch=args.max_batch,
+            encode_batch_size=args.encode_batch_size,
+        )
+        server.serve_forever()
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        os._exit(status)
+
+
+class PreforkMaster:
+    """
+    Forks and supervises the workers sharing one listening socket.
+    """
+
+    def __init__(self, server: ScoringHTTPServer, args):
+        self.server = server
+        self.args = args
+        self.workers = set()
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(self.server, self.args)
+        self.workers.add(pid)
+        return pid
+
+    def run(self) -> None:
+        for _ in range(self.args.workers):
+            self.spawn()
+
+        signal.signal(signal.SIGTERM, _raise_shutdown)
+        signal.signal(signal.SIGINT, _raise_shutdown)
+        signal.signal(
+            signal.SIGUSR1,
+            lambda signum, frame: _print_memory_report(os.getpid(), sorted(self.workers)),
+        )
+        try:
+            while True:
+                pid, status = os.wait()
+                if pid in self.workers:
+                    self.workers.discard(pid)
+                    print(f"worker {pid} exited ({status}); restarting", file=sys.stderr)
+                    self.spawn()
+        except _Shutdown:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.workers.clear()
+
+
+def build_parser():
+    parser = build_service_parser()
+    parser.prog = "prefork.py"
+    parser.description = "Pre-fork HTTP scoring service sharing one loaded model."
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument(
+        "--threads-per-worker", type=int, default=None,
+        help="torch intra-op threads per worker (default: CPU count / workers)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.workers <= 0:
+        print("--workers must be positive", file=sys.stderr)
+        return 2
+    if args.threads_per_worker is None:
+        args.threads_per_worker = max(1, (os.cpu_count() or 1) // args.workers)
+
+    if args.encoder_backend is not None:
+        scoring.set_encoder_backend(args.encoder_backend)
+    scoring.warmup()
+    server = ScoringHTTPServer((args.host, args.port), batcher=None, quiet=args.quiet)
+
+    # Move everything loaded so far out of the collector's reach, so
+    # collections in the workers do not write to (and un-share) its pages.
+    gc.collect()
+    gc.freeze()
+
+    print(
+        f"Scoring service listening on http://{args.host}:{args.port} "
+        f"with {args.workers} workers",
+        file=sys.stderr,
+    )
+    try:
+        PreforkMaster(server, args).run()
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
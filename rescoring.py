@@ -0,0 +1,195 @@
+"""
+Re-score stored results under a new rubric.
+
+Usage:
+    python rescoring.py SCORES.jsonl RESCORED.jsonl --rubric RUBRIC.json
+                        [--chunk-size N]
+
+SCORES.jsonl is the output of `python -m scoring batch` (or any JSONL of
+score_transcript results with an "id"): every result carries the raw
+measurements its scores were derived from (scoring.measure). Those are
+loaded into column arrays and the new rubric's band tables and weights are
+applied to whole columns at once, so re-scoring a term's history takes
+neither the transcripts nor the encoder. RESCORED.jsonl gets one line per
+input with the id, the new component scores and total_score, and the
+previous total for comparison.
+"""
+import argparse
+import json
+import sys
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from batch import chunked
+from rubric import DEFAULT_RUBRIC, Rubric, grammar_fraction, load_rubric
+from scoring import GOOD_TO_HAVE_CONCEPTS, MUST_HAVE_CONCEPTS
+
+# Scalar measurements, loaded as one float64 column each
+MEASUREMENT_COLUMNS = (
+    "total_words",
+    "duration_sec",
+    "wpm",
+    "errors_per_100",
+    "ttr",
+    "filler_rate",
+    "pos",
+    "salutation_score",
+    "has_flow",
+)
+
+SCORE_FIELDS = (
+    "salutation_score",
+    "keyword_score",
+    "flow_score",
+    "speech_score",
+    "grammar_score",
+    "vocab_score",
+    "clarity_score",
+    "engagement_score",
+)
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def measurement_columns(measurements: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Column arrays from a list of scoring.measure() dicts: one float64 array
+    per MEASUREMENT_COLUMNS entry, plus "must_have" and "good_to_have"
+    boolean matrices with one column per concept (in MUST_HAVE_CONCEPTS /
+    GOOD_TO_HAVE_CONCEPTS order).
+    """
+    columns = {
+        name: np.array([m[name] for m in measurements], dtype=np.float64)
+        for name in MEASUREMENT_COLUMNS
+    }
+    for group, concepts in (
+        ("must_have", MUST_HAVE_CONCEPTS),
+        ("good_to_have", GOOD_TO_HAVE_CONCEPTS),
+    ):
+        columns[group] = np.array(
+            [[bool(m["concepts"].get(key, False)) for _, key in concepts] for m in measurements],
+            dtype=bool,
+        ).reshape(len(measurements), len(concepts))
+    return columns
+
+
+def rescore(
+    columns: Dict[str, np.ndarray], rubric: Rubric = DEFAULT_RUBRIC
+) -> Dict[str, np.ndarray]:
+    """
+    Apply `rubric` to measurement columns; returns an int64 array per
+    SCORE_FIELDS entry and "total_score". With DEFAULT_RUBRIC this equals
+    the scores score_transcript produced.
+    """
+    total_words = columns["total_words"]
+    no_words = total_words == 0
+    no_rate = no_words | (columns["duration_sec"] <= 0)
+
+    keyword_score = (
+        columns["must_have"].sum(axis=1) * rubric.must_have_points
+        + columns["good_to_have"].sum(axis=1) * rubric.good_to_have_points
+    )
+    scores = {
+        "salutation_score": columns["salutation_score"].astype(np.int64),
+        "keyword_score": keyword_score.astype(np.int64),
+        "flow_score": np.where(columns["has_flow"] != 0, rubric.flow_points, 0),
+        "speech_score": np.where(no_rate, 0, rubric.speech_rate.score_array(columns["wpm"])),
+        "grammar_score": np.where(
+            no_words, 0, rubric.grammar.score_array(grammar_fraction(columns["errors_per_100"]))
+        ),
+        "vocab_score": np.where(no_words, 0, rubric.vocabulary.score_array(columns["ttr"])),
+        "clarity_score": np.where(
+            no_words, 0, rubric.clarity.score_array(columns["filler_rate"])
+        ),
+        "engagement_score": rubric.engagement.score_array(columns["pos"]),
+    }
+    scores = {name: values.astype(np.int64) for name, values in scores.items()}
+    scores["total_score"] = sum(scores[name] for name in SCORE_FIELDS)
+    return scores
+
+
+def read_results(path: str) -> Iterator[Dict]:
+    """
+    Stream the result lines of a scores JSONL file.
+    """
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if "measurements" not in row:
+                raise ValueError(
+                    f"{path}:{lineno}: no measurements; re-run the batch scorer to store them"
+                )
+            yield row
+
+
+def iter_rescored(
+    results: Iterable[Dict],
+    rubric: Rubric,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict]:
+    """
+    Lazily re-score stored results, `chunk_size` rows of columns at a time;
+    yields {"id", *SCORE_FIELDS, "total_score", "previous_total_score"}
+    per result, in input order.
+    """
+    for chunk in chunked(results, chunk_size):
+        scores = rescore(measurement_columns([row["measurements"] for row in chunk]), rubric)
+        for i, row in enumerate(chunk):
+            out = {"id": row.get("id")}
+            out.update({name: int(values[i]) for name, values in scores.items()})
+            out["previous_total_score"] = row.get("total_score")
+            yield out
+
+
+def rescore_file(
+    input_path: str,
+    output_path: str,
+    rubric: Rubric,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Re-score every result of input_path into output_path (JSONL); returns
+    the number of lines written.
+    """
+    written = 0
+    with open(output_path, "w", encoding="utf-8") as out:
+        for row in iter_rescored(read_results(input_path), rubric, chunk_size):
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+            written += 1
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Re-score stored results under a new rubric without the transcripts."
+    )
+    parser.add_argument("input", help="scores .jsonl with measurements (batch output)")
+    parser.add_argument("output", help="output .jsonl file")
+    parser.add_argument(
+        "--rubric", default=None,
+        help="rubric JSON (see rubric.py; default: the built-in rubric)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help="results re-scored per vectorized chunk",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.chunk_size <= 0:
+        print("--chunk-size must be positive", file=sys.stderr)
+        return 2
+    rubric = load_rubric(args.rubric) if args.rubric else DEFAULT_RUBRIC
+
+    written = rescore_file(args.input, args.output, rubric, args.chunk_size)
+    print(f"Re-scored {written} results ({rubric.name}) -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Rubric band tables and weights.
+
+Every band score is a lookup of one raw measurement (wpm, grammar
+fraction, TTR, filler rate, VADER pos) in a BandTable: an ordered list of
+intervals, each with a score, where the first interval containing the
+value wins and values in none of them get the table's default. The tables
+reproduce the rubric's original if/elif chains exactly, gaps included
+(e.g. 80 <= wpm < 81 is in no interval and scores the default 2).
+
+A new term's rubric is a JSON file with the same shape as
+DEFAULT_RUBRIC.to_dict():
+
+    {
+      "name": "2025-spring",
+      "must_have_points": 4, "good_to_have_points": 2, "flow_points": 5,
+      "speech_rate": {"default": 2, "bands": [
+          {"score": 10, "low": 111, "high": 140, "closed": "both"}, ...]},
+      ...
+    }
+
+scoring.set_rubric() applies it to new transcripts; rescoring applies it
+to measurements already stored in earlier results.
+"""
+import hashlib
+import json
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Which ends of an interval are included, as in pandas.Interval
+CLOSED_SIDES = ("both", "left", "right", "neither")
+
+BAND_FIELDS = ("speech_rate", "grammar", "vocabulary", "clarity", "engagement")
+
+
+class Band:
+    """
+    One interval of a BandTable. A bound of None is unbounded on that side.
+    """
+
+    __slots__ = ("score", "low", "high", "closed")
+
+    def __init__(
+        self,
+        score: int,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        closed: str = "both",
+    ):
+        if closed not in CLOSED_SIDES:
+            raise ValueError(f"closed must be one of {CLOSED_SIDES}, got {closed!r}")
+        self.score = score
+        self.low = low
+        self.high = high
+        self.closed = closed
+
+    def contains(self, value: float) -> bool:
+        if self.low is not None:
+            if self.closed in ("both", "left"):
+                if not value >= self.low:
+                    return False
+            elif not value > self.low:
+                return False
+        if self.high is not None:
+            if self.closed in ("both", "right"):
+                if not value <= self.high:
+                    return False
+            elif not value < self.high:
+                return False
+        return True
+
+    def to_dict(self) -> Dict:
+        return {"score": self.score, "low": self.low, "high": self.high, "closed": self.closed}
+
+    def __repr__(self) -> str:
+        return (
+            f"Band({self.score!r}, low={self.low!r}, high={self.high!r}, "
+            f"closed={self.closed!r})"
+        )
+
+
+class BandTable:
+    """
+    Ordered bands with first-match semantics, plus a default score.
+    """
+
+    def __init__(self, bands: Sequence[Band], default: int):
+        self.bands = list(bands)
+        self.default = default
+        self._compiled_for = None
+        self._compiled = None
+
+    def score(self, value: float) -> int:
+        for band in self.bands:
+            if band.contains(value):
+                return band.score
+        return self.default
+
+    def compile(self) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        The table as sorted breakpoints for score_array.
+
+        Every distinct band edge e contributes the breakpoints e and the
+        next float above it, so consecutive breakpoints cut the real line
+        into pieces [b[i-1], b[i]) that are either a single edge or the open
+        stretch between two edges. Membership of every band is constant on
+        each piece, so a piece's score is score() of its lowest value.
+
+        Returns (breakpoints, piece_scores, nan_score), where piece_scores
+        has one more entry than breakpoints (the piece below the first).
+        """
+        key = (self.default, tuple((b.score, b.low, b.high, b.closed) for b in self.bands))
+        if self._compiled_for != key:
+            edges = sorted(
+                {float(x) for b in self.bands for x in (b.low, b.high) if x is not None}
+            )
+            breakpoints = np.array(
+                [x for edge in edges for x in (edge, np.nextafter(edge, np.inf))],
+                dtype=np.float64,
+            )
+            lowest = np.nextafter(breakpoints[0], -np.inf) if len(edges) else 0.0
+            piece_scores = np.array(
+                [self.score(float(x)) for x in (lowest, *breakpoints)], dtype=np.int64
+            )
+            self._compiled = (breakpoints, piece_scores, self.score(float("nan")))
+            self._compiled_for = key
+        return self._compiled
+
+    def score_array(self, values) -> np.ndarray:
+        """
+        score() for every element of `values`, as an int64 array: one
+        numpy.searchsorted over the compiled breakpoints finds each value's
+        piece (side="right", as pieces are closed on the left).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        breakpoints, piece_scores, nan_score = self.compile()
+        scores = piece_scores[np.searchsorted(breakpoints, values, side="right")]
+        nan = np.isnan(values)
+        if nan.any():
+            scores = np.where(nan, nan_score, scores)
+        return scores
+
+    def to_dict(self) -> Dict:
+        return {"default": self.default, "bands": [band.to_dict() for band in self.bands]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BandTable":
+        return cls([Band(**band) for band in data["bands"]], data["default"])
+
+
+class Rubric:
+    """
+    The five band tables plus the keyword and flow weights.
+
+    The grammar table is looked up with grammar_fraction(errors_per_100),
+    the other tables with the measurement itself.
+    """
+
+    def __init__(
+        self,
+        speech_rate: BandTable,
+        grammar: BandTable,
+        vocabulary: BandTable,
+        clarity: BandTable,
+        engagement: BandTable,
+        must_have_points: int = 4,
+        good_to_have_points: int = 2,
+        flow_points: int = 5,
+        name: str = "custom",
+    ):
+        self.speech_rate = speech_rate
+        self.grammar = grammar
+        self.vocabulary = vocabulary
+        self.clarity = clarity
+        self.engagement = engagement
+        self.must_have_points = must_have_points
+        self.good_to_have_points = good_to_have_points
+        self.flow_points = flow_points
+        self.name = name
+
+    def to_dict(self) -> Dict:
+        data = {
+            "name": self.name,
+            "must_have_points": self.must_have_points,
+            "good_to_have_points": self.good_to_have_points,
+            "flow_points": self.flow_points,
+        }
+        for field in BAND_FIELDS:
+            data[field] = getattr(self, field).to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Rubric":
+        missing = [field for field in BAND_FIELDS if field not in data]
+        if missing:
+            raise ValueError(f"rubric is missing band table(s) {', '.join(missing)}")
+        return cls(
+            **{field: BandTable.from_dict(data[field]) for field in BAND_FIELDS},
+            must_have_points=data.get("must_have_points", 4),
+            good_to_have_points=data.get("good_to_have_points", 2),
+            flow_points=data.get("flow_points", 5),
+            name=data.get("name", "custom"),
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Short hash of the tables and weights, for cache keys.
+        """
+        body = json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")
+        return hashlib.sha256(body).hexdigest()[:12]
+
+
+def load_rubric(path: str) -> Rubric:
+    with open(path, encoding="utf-8") as f:
+        return Rubric.from_dict(json.load(f))
+
+
+def grammar_fraction(errors_per_100):
+    """
+    Share of the grammar scale left after errors: 1 - min(errors_per_100 / 20, 1).
+    Works on floats and arrays alike.
+    """
+    return 1 - np.minimum(np.asarray(errors_per_100, dtype=np.float64) / 20.0, 1.0)
+
+
+# -----------------------------
+# The rubric as originally specified
+# -----------------------------
+def _default_bands() -> Dict[str, BandTable]:
+    return {
+        # Too slow (< 80) or too fast (> 161) -> 2; slow (81-110) or
+        # fast (141-160) -> 6; ideal (111-140) -> 10; anything else -> 2
+        "speech_rate": BandTable(
+            [
+                Band(2, high=80, closed="neither"),
+                Band(2, low=161, closed="neither"),
+                Band(6, low=81, high=110),
+                Band(6, low=141, high=160),
+                Band(10, low=111, high=140),
+            ],
+            default=2,
+        ),
+        # on grammar_fraction(errors_per_100)
+        "grammar": BandTable(
+            [
+                Band(10, low=0.8, closed="neither"),
+                Band(8, low=0.6, high=0.8),
+                Band(6, low=0.4, high=0.6, closed="left"),
+                Band(4, low=0.2, high=0.4, closed="left"),
+            ],
+            default=2,
+        ),
+        "vocabulary": BandTable(
+            [
+                Band(10, low=0.9, high=1.0),
+                Band(8, low=0.7, high=0.9, closed="left"),
+                Band(6, low=0.5, high=0.7, closed="left"),
+                Band(4, low=0.3, high=0.5, closed="left"),
+            ],
+            default=2,
+        ),
+        # filler rate in percent
+        "clarity": BandTable(
+            [
+                Band(15, low=0, high=3),
+                Band(12, low=4, high=6),
+                Band(9, low=7, high=9),
+                Band(6, low=10, high=12),
+            ],
+            default=3,
+        ),
+        # VADER pos
+        "engagement": BandTable(
+            [
+                Band(15, low=0.7, closed="left"),
+                Band(12, low=0.5, high=0.7, closed="left"),
+                Band(9, low=0.3, high=0.5, closed="left"),
+                Band(6, low=0.1, high=0.3, closed="left"),
+            ],
+            default=3,
+        ),
+    }
+
+
+DEFAULT_RUBRIC = Rubric(**_default_bands(), name="default")
@@ -0,0 +1,173 @@
+"""
+Client for the scoring daemon (daemon.py).
+
+    from scorer_client import score_transcript
+    result = score_transcript(text, duration_sec=60)
+
+score_transcript has the same signature and returns the same dict as
+scoring.score_transcript, but the work happens in the long-lived daemon,
+which already has the model loaded: a short-lived script pays only for
+this module (standard library only, no numpy/torch) and one round trip.
+
+Wire format, both directions: a 4-byte big-endian length followed by that
+many bytes of UTF-8 JSON. Requests are {"op": "score", ...arguments} or
+{"op": "ping"}; replies are {"ok": true, "result": ...} or
+{"ok": false, "error": message, "type": exception class name}.
+"""
+import json
+import os
+import socket
+import struct
+import tempfile
+import threading
+from typing import Dict, Optional
+
+SOCKET_ENV_VAR = "SCORER_SOCKET"
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+class ScorerDaemonError(RuntimeError):
+    """
+    The daemon failed to score a request (other than bad arguments, which
+    raise ValueError as they would in-process).
+    """
+
+
+def default_socket_path() -> str:
+    """
+    $SCORER_SOCKET, else a per-user socket in $XDG_RUNTIME_DIR or the temp dir.
+    """
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"ai_communication_scorer-{os.getuid()}.sock")
+
+
+def send_frame(sock: socket.socket, payload: Dict) -> None:
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict]:
+    """
+    Read one frame; None if the peer closed the connection between frames.
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"frame of {size} bytes exceeds MAX_FRAME_BYTES")
+    body = _recv_exact(sock, size)
+    if body is None:
+        raise ConnectionError("connection closed mid-frame")
+    return json.loads(body)
+
+
+class ScorerClient:
+    """
+    One persistent connection to the daemon; requests on it are serialised.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def request(self, payload: Dict) -> Dict:
+        with self._lock:
+            sock = self._connect()
+            try:
+                send_frame(sock, payload)
+                reply = recv_frame(sock)
+            except BaseException:
+                self.close()
+                raise
+            if reply is None:
+                self.close()
+                raise ConnectionError("scoring daemon closed the connection")
+
+        if reply.get("ok"):
+            return reply.get("result")
+        if reply.get("type") == "ValueError":
+            raise ValueError(reply.get("error"))
+        raise ScorerDaemonError(f"{reply.get('type')}: {reply.get('error')}")
+
+    def ping(self) -> bool:
+        return self.request({"op": "ping"}) == "pong"
+
+    def score_transcript(
+        self,
+        text,
+        duration_sec: float,
+        embedding_mode: str = "document",
+        parallel: bool = False,
+        timings: bool = False,
+        mode: str = "full",
+    ) -> Dict:
+        return self.request(
+            {
+                "op": "score",
+                # a TranscriptAnalysis is sent as its raw text
+                "text": getattr(text, "raw_text", text),
+                "duration_sec": duration_sec,
+                "embedding_mode": embedding_mode,
+                "parallel": parallel,
+                "timings": timings,
+                "mode": mode,
+            }
+        )
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+_default_client = None
+
+
+def score_transcript(
+    text,
+    duration_sec: float,
+    embedding_mode: str = "document",
+    parallel: bool = False,
+    timings: bool = False,
+    mode: str = "full",
+) -> Dict:
+    """
+    scoring.score_transcript, served by the daemon at default_socket_path().
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = ScorerClient()
+    return _default_client.score_transcript(
+        text, duration_sec, embedding_mode, parallel=parallel, timings=timings, mode=mode
+    )
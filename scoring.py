@@ -1,23 +1,31 @@
-from typing import Dict, List, Tuple
-
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from sentence_transformers import SentenceTransformer, util
-
+import copy
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import embedding_cache
+import encoders
+from caching import LRUCache
+from feature_store import FeatureStore, text_hash
+from instrumentation import NULL_TIMER, StageTimer, get_metrics_sink
+from rubric import DEFAULT_RUBRIC, Rubric, grammar_fraction
 from text_utils import (
-    preprocess_text,
+    TranscriptAnalysis,
+    as_analysis,
     get_basic_stats,
     compute_ttr,
     count_filler_words,
     detect_salutation_level,
     detect_keywords,
-    detect_structure_tags,
 )
 
 # -----------------------------
 # External tools (sentiment + embeddings only)
 # -----------------------------
-analyzer = SentimentIntensityAnalyzer()
-sem_model = SentenceTransformer("all-MiniLM-L6-v2")
+SEM_MODEL_NAME = "all-MiniLM-L6-v2"
 
 # Short "ideal" descriptions for each high-level rubric dimension
 CRITERION_DESCRIPTIONS = {
@@ -38,18 +46,213 @@ CRITERION_DESCRIPTIONS = {
         "making the listener interested in the speaker."
     ),
 }
+CRITERION_KEYS = list(CRITERION_DESCRIPTIONS.keys())
+
+# Scoring functions that read transcript text accept either the text itself
+# or a TranscriptAnalysis sharing its derived views (see text_utils).
+TextInput = Union[str, TranscriptAnalysis]
+
+# "full" scores the rubric and the semantic similarities; "fast" runs only
+# the rule-based and VADER stages and leaves the *_semantic fields None, so
+# the sentence encoder (and torch) is never loaded.
+SCORING_MODES = ("full", "fast")
+DEFAULT_SCORING_MODE = "full"
+
+# The analyzer, the sentence-transformer and the criterion embeddings are
+# built on first use (see the get_* accessors below), so importing this
+# module does not pull in torch or load MiniLM.
+_analyzer = None
+_sem_model = None
+_criterion_embeddings = None
+_criterion_matrix = None
+_encoder_backend = None
+_load_lock = threading.RLock()
+
+
+def get_analyzer():
+    """
+    Return the shared VADER SentimentIntensityAnalyzer, creating it on first use.
+    """
+    global _analyzer
+    if _analyzer is None:
+        with _load_lock:
+            if _analyzer is None:
+                from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+                _analyzer = SentimentIntensityAnalyzer()
+    return _analyzer
+
+
+def get_encoder_backend() -> str:
+    """
+    Name of the encoder backend in use (see encoders.ENCODER_BACKENDS).
+    Defaults to $SCORER_ENCODER_BACKEND, read on first use.
+    """
+    global _encoder_backend
+    if _encoder_backend is None:
+        with _load_lock:
+            if _encoder_backend is None:
+                _encoder_backend = encoders.configured_backend()
+    return _encoder_backend
+
+
+def set_encoder_backend(backend: str) -> None:
+    """
+    Switch encoder backend. The loaded model and criterion embeddings are
+    dropped and rebuilt for the new backend on next use.
+    """
+    global _encoder_backend, _sem_model, _criterion_embeddings, _criterion_matrix
+    encoders.check_backend(backend)
+    with _load_lock:
+        if backend != _encoder_backend:
+            _encoder_backend = backend
+            _sem_model = None
+            _criterion_embeddings = None
+            _criterion_matrix = None
+
+
+def encoder_model_key() -> str:
+    """
+    Model + backend identifier that cached embeddings and results are keyed by.
+    """
+    return encoders.model_key(SEM_MODEL_NAME, get_encoder_backend())
+
+
+def get_sem_model():
+    """
+    Return the shared sentence encoder for the configured backend, loading
+    it on first use.
+    """
+    global _sem_model
+    if _sem_model is None:
+        with _load_lock:
+            if _sem_model is None:
+                _sem_model = encoders.load_encoder(SEM_MODEL_NAME, get_encoder_backend())
+    return _sem_model
+
+
+def _encode_normalized(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """
+    Encode texts into L2-normalised float32 vectors (one row per text), so
+    cosine similarity reduces to a dot product.
+
+    Texts are fed to the encoder shortest first, so each mini-batch holds
+    texts of similar length and a short transcript is not padded out to the
+    longest one in the call; rows come back in input order.
+    """
+    model = get_sem_model()
+    if len(texts) <= 1:
+        return model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+
+    # Word count tracks token count closely enough to group by length
+    # without tokenising every text twice.
+    order = np.argsort([len(text.split()) for text in texts], kind="stable")
+    sorted_embs = model.encode(
+        [texts[i] for i in order],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    embs = np.empty_like(sorted_embs)
+    embs[order] = sorted_embs
+    return embs
+
+
+def get_criterion_embeddings() -> Dict[str, np.ndarray]:
+    """
+    Return {criterion_key: normalised embedding} for CRITERION_DESCRIPTIONS.
+
+    Vectors come from the on-disk cache in embedding_cache (memory-mapped);
+    a description is only re-encoded when its text or the model changes.
+    """
+    global _criterion_embeddings
+    if _criterion_embeddings is None:
+        with _load_lock:
+            if _criterion_embeddings is None:
+                _criterion_embeddings = embedding_cache.load_or_encode(
+                    CRITERION_DESCRIPTIONS, encoder_model_key(), _encode_normalized
+                )
+    return _criterion_embeddings
+
+
+def get_criterion_matrix() -> np.ndarray:
+    """
+    Return the criterion embeddings stacked into one (num_criteria x dim)
+    matrix in CRITERION_KEYS order, so a transcript can be compared against
+    every criterion with a single matrix product.
+    """
+    global _criterion_matrix
+    if _criterion_matrix is None:
+        with _load_lock:
+            if _criterion_matrix is None:
+                embeddings = get_criterion_embeddings()
+                _criterion_matrix = np.stack([embeddings[key] for key in CRITERION_KEYS])
+    return _criterion_matrix
+
+
+def check_scoring_mode(mode: str) -> str:
+    if mode not in SCORING_MODES:
+        raise ValueError(f"unknown mode {mode!r}; expected one of {SCORING_MODES}")
+    return mode
+
 
-# Pre-compute embeddings for the criterion descriptions
-CRITERION_EMBEDDINGS = {
-    key: sem_model.encode(desc, convert_to_tensor=True)
-    for key, desc in CRITERION_DESCRIPTIONS.items()
+def warmup(mode: str = DEFAULT_SCORING_MODE) -> None:
+    """
+    Eagerly build the analyzer, the model and the criterion embeddings
+    (only the analyzer for mode="fast").
+
+    Servers call this at startup so the first request does not pay the
+    model load.
+    """
+    get_analyzer()
+    if check_scoring_mode(mode) == "full":
+        # the criterion embeddings may come from the on-disk cache without
+        # touching the model, so load it explicitly
+        get_sem_model()
+        get_criterion_matrix()
+
+
+# Backwards-compatible module attributes (scoring.sem_model etc.),
+# resolved lazily through the accessors above.
+_LAZY_ATTRS = {
+    "analyzer": get_analyzer,
+    "sem_model": get_sem_model,
+    "CRITERION_EMBEDDINGS": get_criterion_embeddings,
+    "CRITERION_MATRIX": get_criterion_matrix,
 }
 
 
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # -----------------------------
 # Rule-based scoring functions
 # -----------------------------
-def score_salutation(text: str) -> int:
+# Band tables and weights every score_* function reads (see rubric).
+_rubric = DEFAULT_RUBRIC
+_rubric_fingerprint = DEFAULT_RUBRIC.fingerprint()
+
+
+def get_rubric() -> Rubric:
+    return _rubric
+
+
+def set_rubric(new_rubric: Optional[Rubric] = None) -> None:
+    """
+    Score with `new_rubric` from now on (None restores DEFAULT_RUBRIC).
+    Results cached under another rubric are not served (see scorer_version).
+    """
+    global _rubric, _rubric_fingerprint
+    _rubric = new_rubric if new_rubric is not None else DEFAULT_RUBRIC
+    _rubric_fingerprint = _rubric.fingerprint()
+
+
+def score_salutation(text: TextInput) -> int:
     """
     Salutation score: 0, 2, 4, or 5 based on greeting quality.
     Delegated to detect_salutation_level from text_utils.
@@ -57,7 +260,49 @@ def score_salutation(text: str) -> int:
     return detect_salutation_level(text)
 
 
-def score_keywords(text: str) -> Tuple[int, List[str], List[str]]:
+# (label, detect_keywords key) pairs, worth the rubric's must_have_points
+# and good_to_have_points (4 and 2 by default) respectively
+MUST_HAVE_CONCEPTS = [
+    ("Name", "has_name"),
+    ("Age", "has_age"),
+    ("School/Class", "has_school_class"),
+    ("Family", "has_family"),
+    ("Hobbies/Interests", "has_hobbies"),
+]
+GOOD_TO_HAVE_CONCEPTS = [
+    ("About family (details)", "has_about_family"),
+    ("Location/Origin", "has_location"),
+    ("Ambition/Goal/Dream", "has_ambition"),
+    ("Fun fact / Unique thing", "has_fun_fact"),
+    ("Strengths/Achievements", "has_strengths_or_achievements"),
+]
+
+
+def _keyword_score(kw: Dict[str, bool]) -> Tuple[int, List[str], List[str]]:
+    score = 0
+    present = []
+    missing = []
+
+    # Must-haves: 4 points each
+    for label, key in MUST_HAVE_CONCEPTS:
+        if kw.get(key, False):
+            score += _rubric.must_have_points
+            present.append(label)
+        else:
+            missing.append(label)
+
+    # Good-to-haves: 2 points each
+    for label, key in GOOD_TO_HAVE_CONCEPTS:
+        if kw.get(key, False):
+            score += _rubric.good_to_have_points
+            present.append(label)
+        else:
+            missing.append(label)
+
+    return score, present, missing
+
+
+def score_keywords(text: TextInput) -> Tuple[int, List[str], List[str]]:
     """
     Keyword coverage according to rubric.
 
@@ -80,44 +325,7 @@ def score_keywords(text: str) -> Tuple[int, List[str], List[str]]:
       present_concepts (labels),
       missing_concepts (labels)
     """
-    kw = detect_keywords(text)
-
-    must_haves = [
-        ("Name", "has_name"),
-        ("Age", "has_age"),
-        ("School/Class", "has_school_class"),
-        ("Family", "has_family"),
-        ("Hobbies/Interests", "has_hobbies"),
-    ]
-    good_to_have = [
-        ("About family (details)", "has_about_family"),
-        ("Location/Origin", "has_location"),
-        ("Ambition/Goal/Dream", "has_ambition"),
-        ("Fun fact / Unique thing", "has_fun_fact"),
-        ("Strengths/Achievements", "has_strengths_or_achievements"),
-    ]
-
-    score = 0
-    present = []
-    missing = []
-
-    # Must-haves: 4 points each
-    for label, key in must_haves:
-        if kw.get(key, False):
-            score += 4
-            present.append(label)
-        else:
-            missing.append(label)
-
-    # Good-to-haves: 2 points each
-    for label, key in good_to_have:
-        if kw.get(key, False):
-            score += 2
-            present.append(label)
-        else:
-            missing.append(label)
-
-    return score, present, missing
+    return _keyword_score(detect_keywords(text))
 
 
 def score_flow(sentences: List[str], tags: List[str]) -> int:
@@ -131,16 +339,22 @@ def score_flow(sentences: List[str], tags: List[str]) -> int:
 
     If all three exist -> 5, else -> 0.
     """
-    if not sentences or not tags:
-        return 0
+    return _flow_band(len(sentences), tags)
+
+
+def _flow_band(sentence_count: int, tags: List[str]) -> int:
+    return _rubric.flow_points if _has_flow(sentence_count, tags) else 0
+
+
+def _has_flow(sentence_count: int, tags: List[str]) -> bool:
+    if not sentence_count or not tags:
+        return False
 
     has_sal = "SALUTATION" in tags
     has_basic = "BASIC" in tags
     has_closing = "CLOSING" in tags
 
-    if has_sal and has_basic and has_closing:
-        return 5
-    return 0
+    return has_sal and has_basic and has_closing
 
 
 def score_speech_rate(total_words: int, duration_sec: float) -> Tuple[int, float]:
@@ -155,20 +369,16 @@ def score_speech_rate(total_words: int, duration_sec: float) -> Tuple[int, float
         return 0, 0.0
 
     wpm = (total_words * 60.0) / duration_sec
+    return _speech_rate_band(wpm), wpm
 
-    if wpm < 80 or wpm > 161:
-        score = 2
-    elif 81 <= wpm <= 110 or 141 <= wpm <= 160:
-        score = 6
-    elif 111 <= wpm <= 140:
-        score = 10
-    else:
-        score = 2
 
-    return score, wpm
+def _speech_rate_band(wpm: float) -> int:
+    return _rubric.speech_rate.score(wpm)
 
 
-def score_grammar(text: str, total_words: int) -> Tuple[int, float]:
+def score_grammar(
+    text: TextInput, total_words: int
+) -> Tuple[int, float]:
     """
     Grammar scoring – local heuristic version (no external API).
 
@@ -191,36 +401,34 @@ def score_grammar(text: str, total_words: int) -> Tuple[int, float]:
     if total_words == 0:
         return 0, 0.0
 
-    lower_text = text.lower()
+    errors_per_100 = _grammar_errors_per_100(text, total_words)
+    return _grammar_band(errors_per_100), errors_per_100
+
+
+def _grammar_errors_per_100(text: TextInput, total_words: int) -> float:
+    if isinstance(text, TranscriptAnalysis):
+        raw_text, lower_text, raw_tokens = text.raw_text, text.lower_text, text.raw_tokens
+    else:
+        raw_text, lower_text, raw_tokens = text, text.lower(), text.split()
 
     # heuristic "errors"
     lower_i_errors = lower_text.count(" i ")  # lowercase i as standalone pronoun
-    double_space_errors = text.count("  ")
+    double_space_errors = raw_text.count("  ")
 
     weird_tokens = [
         tok
-        for tok in text.split()
+        for tok in raw_tokens
         if any(ch.isdigit() for ch in tok) and any(ch.isalpha() for ch in tok)
     ]
     weird_punc_errors = len(weird_tokens)
 
     errors_est = lower_i_errors + double_space_errors + weird_punc_errors
-    errors_per_100 = min((errors_est / max(total_words, 1)) * 100.0, 100.0)
-
-    gram_frac = 1 - min(errors_per_100 / 20.0, 1.0)
+    return min((errors_est / max(total_words, 1)) * 100.0, 100.0)
 
-    if gram_frac > 0.8:
-        score = 10
-    elif 0.6 <= gram_frac <= 0.8:
-        score = 8
-    elif 0.4 <= gram_frac < 0.6:
-        score = 6
-    elif 0.2 <= gram_frac < 0.4:
-        score = 4
-    else:
-        score = 2
 
-    return score, errors_per_100
+def _grammar_band(errors_per_100: float) -> int:
+    gram_frac = 1 - min(errors_per_100 / 20.0, 1.0)
+    return _rubric.grammar.score(gram_frac)
 
 
 def score_vocabulary(total_words: int, distinct_words: int) -> Tuple[int, float]:
@@ -237,22 +445,35 @@ def score_vocabulary(total_words: int, distinct_words: int) -> Tuple[int, float]
         return 0, 0.0
 
     ttr = compute_ttr(total_words, distinct_words)
-
-    if 0.9 <= ttr <= 1.0:
-        score = 10
-    elif 0.7 <= ttr < 0.9:
-        score = 8
-    elif 0.5 <= ttr < 0.7:
-        score = 6
-    elif 0.3 <= ttr < 0.5:
-        score = 4
-    else:
-        score = 2
-
-    return score, ttr
-
-
-def score_clarity(text: str, total_words: int) -> Tuple[int, float, int]:
+    return _vocabulary_band(ttr), ttr
+
+
+def _vocabulary_band(ttr: float) -> int:
+    return _rubric.vocabulary.score(ttr)
+
+
+FILLER_WORDS = [
+    "um",
+    "uh",
+    "like",
+    "you know",
+    "so",
+    "actually",
+    "basically",
+    "right",
+    "i mean",
+    "well",
+    "kinda",
+    "sort of",
+    "okay",
+    "hmm",
+    "ah",
+]
+
+
+def score_clarity(
+    text: TextInput, total_words: int
+) -> Tuple[int, float, int]:
     """
     Clarity via filler word rate.
 
@@ -266,42 +487,16 @@ def score_clarity(text: str, total_words: int) -> Tuple[int, float, int]:
     if total_words == 0:
         return 0, 0.0, 0
 
-    fillers = [
-        "um",
-        "uh",
-        "like",
-        "you know",
-        "so",
-        "actually",
-        "basically",
-        "right",
-        "i mean",
-        "well",
-        "kinda",
-        "sort of",
-        "okay",
-        "hmm",
-        "ah",
-    ]
-
-    filler_count = count_filler_words(text, fillers)
+    filler_count = count_filler_words(text, FILLER_WORDS)
     filler_rate = (filler_count / total_words) * 100.0
+    return _clarity_band(filler_rate), filler_rate, filler_count
 
-    if 0 <= filler_rate <= 3:
-        score = 15
-    elif 4 <= filler_rate <= 6:
-        score = 12
-    elif 7 <= filler_rate <= 9:
-        score = 9
-    elif 10 <= filler_rate <= 12:
-        score = 6
-    else:
-        score = 3
 
-    return score, filler_rate, filler_count
+def _clarity_band(filler_rate: float) -> int:
+    return _rubric.clarity.score(filler_rate)
 
 
-def score_engagement(text: str) -> Tuple[int, float]:
+def score_engagement(text: TextInput) -> Tuple[int, float]:
     """
     Engagement via sentiment (VADER).
 
@@ -313,87 +508,440 @@ def score_engagement(text: str) -> Tuple[int, float]:
       0.1–0.29      -> 6
       < 0.1         -> 3
     """
-    scores = analyzer.polarity_scores(text)
+    if isinstance(text, TranscriptAnalysis):
+        text = text.raw_text
+
+    scores = get_analyzer().polarity_scores(text)
     pos = scores.get("pos", 0.0)
+    return _engagement_band(pos), pos
 
-    if pos >= 0.7:
-        score = 15
-    elif 0.5 <= pos < 0.7:
-        score = 12
-    elif 0.3 <= pos < 0.5:
-        score = 9
-    elif 0.1 <= pos < 0.3:
-        score = 6
-    else:
-        score = 3
 
-    return score, pos
+def _engagement_band(pos: float) -> int:
+    return _rubric.engagement.score(pos)
+
+
+# -----------------------------
+# Vectorized band functions
+# -----------------------------
+# Array versions of the band lookups above for cohort analytics over
+# stored measurements (see measure): each takes an array of one
+# measurement and returns an int64 array of scores equal, element by
+# element, to the scalar band of the current rubric (gaps such as
+# 80 <= wpm < 81 and NaN included). The band tables are compiled into
+# sorted edges and looked up with numpy.searchsorted (BandTable.score_array).
+# Like the scalar bands they do not apply the empty-transcript / zero
+# duration rules; see rescoring.rescore for whole results.
+def speech_rate_band_array(wpm) -> np.ndarray:
+    return _rubric.speech_rate.score_array(wpm)
+
+
+def grammar_band_array(errors_per_100) -> np.ndarray:
+    return _rubric.grammar.score_array(grammar_fraction(errors_per_100))
+
+
+def vocabulary_band_array(ttr) -> np.ndarray:
+    return _rubric.vocabulary.score_array(ttr)
+
+
+def clarity_band_array(filler_rate) -> np.ndarray:
+    return _rubric.clarity.score_array(filler_rate)
+
+
+def engagement_band_array(pos) -> np.ndarray:
+    return _rubric.engagement.score_array(pos)
 
 
 # -----------------------------
 # Semantic similarity helpers
 # -----------------------------
-def compute_semantic_similarity(text: str, criterion_key: str) -> float:
+DEFAULT_BATCH_SIZE = 32
+
+# How a transcript is turned into one vector:
+#   "document": the whole cleaned transcript is encoded in one pass.
+#   "sentence": every sentence is encoded separately (through a cache shared
+#               across transcripts) and the sentence vectors are mean-pooled.
+#               Scores differ slightly from "document" mode, but formulaic
+#               sentences ("thank you for listening") are encoded only once.
+#   "chunked":  the cleaned transcript is split into overlapping windows of
+#               the model's max_seq_length tokens, all windows are encoded in
+#               one batch and pooled, so a long speech is judged on all of
+#               it rather than on what fits before truncation. Transcripts
+#               that fit in one window score exactly as in "document" mode.
+EMBEDDING_MODES = ("document", "sentence", "chunked")
+DEFAULT_EMBEDDING_MODE = "document"
+
+# Tokens shared by consecutive windows in "chunked" mode.
+CHUNK_OVERLAP_TOKENS = 32
+# At most this many windows are encoded per transcript; beyond that,
+# windows are picked evenly across the transcript so cost stays bounded.
+MAX_CHUNKS = 64
+
+SENTENCE_CACHE_SIZE = 50000
+_sentence_cache = LRUCache(maxsize=SENTENCE_CACHE_SIZE)
+
+
+def sentence_cache_stats() -> Dict:
+    """
+    Hit / miss / eviction counters of the sentence embedding cache.
+    """
+    return _sentence_cache.stats()
+
+
+def _encode_by_sentences(
+    texts: List[TextInput], batch_size: int, timer: StageTimer = NULL_TIMER
+) -> np.ndarray:
+    """
+    Document vectors pooled from cached sentence vectors.
+
+    Sentences come from get_basic_stats; every sentence not yet in the
+    sentence cache is encoded in one batch, then each document vector is
+    the re-normalised mean of its sentence vectors.
+    """
+    model_key = encoder_model_key()
+    doc_sentences = []
+    vectors_by_key = {}
+    unseen = {}
+    for text in texts:
+        sentences = get_basic_stats(text)["sentences"] or [_text_to_encode(text)]
+        keys = []
+        for sentence in sentences:
+            key = (model_key, hashlib.sha1(sentence.encode("utf-8")).hexdigest())
+            if key not in vectors_by_key and key not in unseen:
+                vector = _sentence_cache.get(key)
+                if vector is None:
+                    unseen[key] = sentence
+                else:
+                    vectors_by_key[key] = vector
+            keys.append(key)
+        doc_sentences.append(keys)
+
+    if unseen:
+        with timer.stage("encode"):
+            vectors = _encode_normalized(list(unseen.values()), batch_size=batch_size)
+        for key, vector in zip(unseen, vectors):
+            vectors_by_key[key] = vector
+            _sentence_cache.put(key, vector)
+
+    doc_vectors = []
+    for keys in doc_sentences:
+        pooled = np.mean([vectors_by_key[key] for key in keys], axis=0)
+        norm = np.linalg.norm(pooled)
+        doc_vectors.append(pooled / norm if norm > 0 else pooled)
+
+    return np.stack(doc_vectors)
+
+
+def _chunk_spans(text: str, overlap: int = CHUNK_OVERLAP_TOKENS) -> List[Tuple[int, int, int]]:
+    """
+    (start_char, end_char, num_tokens) of the overlapping token windows
+    covering `text`; one window for text that fits the model in one pass.
+    """
+    model = get_sem_model()
+    offsets = encoders.token_offsets(model, text)
+    window = model.max_seq_length - 2  # room for [CLS] and [SEP]
+    if len(offsets) <= window:
+        return [(0, len(text), len(offsets))]
+
+    stride = max(1, window - overlap)
+    starts = list(range(0, len(offsets) - overlap, stride))
+    if len(starts) > MAX_CHUNKS:
+        starts = [starts[i] for i in np.linspace(0, len(starts) - 1, MAX_CHUNKS).astype(int)]
+
+    spans = []
+    for first in starts:
+        last = min(first + window, len(offsets)) - 1
+        spans.append((offsets[first][0], offsets[last][1], last - first + 1))
+    return spans
+
+
+def compute_chunk_similarities(
+    text: TextInput, batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[Dict]:
+    """
+    Per-window similarities for "chunked" mode: one dict per window with
+    its "start" / "end" character offsets into the cleaned transcript and
+    a similarity in [0, 1] per criterion.
+    """
+    doc = _text_to_encode(text)
+    spans = _chunk_spans(doc)
+    criterion_matrix = get_criterion_matrix()
+    embs = _encode_normalized([doc[start:end] for start, end, _ in spans], batch_size)
+
+    windows = []
+    for (start, end, _), emb in zip(spans, embs):
+        window = {"start": start, "end": end}
+        for key, sim in zip(CRITERION_KEYS, (criterion_matrix @ emb).tolist()):
+            window[key] = max(0.0, min(1.0, sim))
+        windows.append(window)
+    return windows
+
+
+def _encode_by_chunks(
+    texts: List[TextInput], batch_size: int, timer: StageTimer = NULL_TIMER
+) -> np.ndarray:
+    """
+    Document vectors pooled from overlapping token windows.
+
+    The windows of all texts are encoded in a single call; each document
+    vector is the token-count-weighted mean of its window vectors,
+    re-normalised.
+    """
+    docs = [_text_to_encode(text) for text in texts]
+    with timer.stage("chunk"):
+        doc_spans = [_chunk_spans(doc) for doc in docs]
+
+    windows = [doc[start:end] for doc, spans in zip(docs, doc_spans) for start, end, _ in spans]
+    with timer.stage("encode"):
+        vectors = _encode_normalized(windows, batch_size=batch_size)
+
+    doc_vectors = []
+    offset = 0
+    for spans in doc_spans:
+        chunk_vectors = vectors[offset:offset + len(spans)]
+        offset += len(spans)
+        if len(spans) == 1:
+            doc_vectors.append(chunk_vectors[0])
+            continue
+        weights = np.array([n for _, _, n in spans], dtype=np.float32)
+        pooled = weights @ chunk_vectors / weights.sum()
+        norm = np.linalg.norm(pooled)
+        doc_vectors.append(pooled / norm if norm > 0 else pooled)
+
+    return np.stack(doc_vectors)
+
+
+def _text_to_encode(text: TextInput) -> str:
+    # An analysis is embedded through its cleaned text, as in score_transcript
+    return text.clean_text if isinstance(text, TranscriptAnalysis) else text
+
+
+def _encode_documents(
+    texts: List[TextInput],
+    batch_size: int,
+    embedding_mode: str,
+    timer: StageTimer = NULL_TIMER,
+) -> np.ndarray:
+    if embedding_mode == "document":
+        docs = [_text_to_encode(t) for t in texts]
+        with timer.stage("encode"):
+            return _encode_normalized(docs, batch_size=batch_size)
+    if embedding_mode == "sentence":
+        return _encode_by_sentences(texts, batch_size=batch_size, timer=timer)
+    if embedding_mode == "chunked":
+        return _encode_by_chunks(texts, batch_size=batch_size, timer=timer)
+    raise ValueError(
+        f"unknown embedding_mode {embedding_mode!r}; expected one of {EMBEDDING_MODES}"
+    )
+
+
+def compute_semantic_similarities_batch(
+    texts: Sequence[TextInput],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    timer: StageTimer = NULL_TIMER,
+) -> List[Dict[str, float]]:
+    """
+    Semantic similarities for many transcripts at once.
+
+    All texts go through sem_model.encode in mini-batches of `batch_size`
+    (see EMBEDDING_MODES for how a text becomes one vector), then each
+    embedding is compared against the criterion matrix.
+
+    Returns one {criterion_key: similarity in [0, 1]} dict per text.
+    """
+    if not texts:
+        return []
+
+    with timer.stage("model_load"):
+        criterion_matrix = get_criterion_matrix()
+    text_embs = _encode_documents(list(texts), batch_size, embedding_mode, timer)
+    return _similarities(criterion_matrix, text_embs, timer)
+
+
+def _similarities(
+    criterion_matrix: np.ndarray, text_embs: Sequence[np.ndarray], timer: StageTimer = NULL_TIMER
+) -> List[Dict[str, float]]:
+    with timer.stage("similarity"):
+        # One (num_criteria x dim) @ (dim,) product per text: a single big
+        # matmul would round differently depending on the batch shape, and
+        # a batched result must match the single-item one exactly.
+        sim_rows = [(criterion_matrix @ emb).tolist() for emb in text_embs]
+
+    return [
+        {key: max(0.0, min(1.0, sim)) for key, sim in zip(CRITERION_KEYS, row)}
+        for row in sim_rows
+    ]
+
+
+def compute_semantic_similarities(
+    text: TextInput,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    timer: StageTimer = NULL_TIMER,
+) -> Dict[str, float]:
+    """
+    Compute cosine similarity between the transcript and the ideal
+    description of every high-level criterion.
+
+    The transcript is encoded once and compared against the criterion
+    matrix in one matrix product.
+
+    Returns {criterion_key: similarity in [0, 1]}.
+    """
+    return compute_semantic_similarities_batch(
+        [text], embedding_mode=embedding_mode, timer=timer
+    )[0]
+
+
+def compute_semantic_similarity(text: TextInput, criterion_key: str) -> float:
     """
     Compute cosine similarity between the transcript and the
     ideal description for a given high-level criterion.
 
+    Thin wrapper around compute_semantic_similarities; prefer that one
+    when more than one criterion is needed.
+
     Returns a value in [0, 1].
     """
-    if criterion_key not in CRITERION_EMBEDDINGS:
+    if criterion_key not in CRITERION_DESCRIPTIONS:
         return 0.0
 
-    text_emb = sem_model.encode(text, convert_to_tensor=True)
-    crit_emb = CRITERION_EMBEDDINGS[criterion_key]
-    sim = util.pytorch_cos_sim(text_emb, crit_emb).item()
-
-    sim = max(0.0, min(1.0, sim))
-    return sim
+    return compute_semantic_similarities(text)[criterion_key]
 
 
 # -----------------------------
 # Master scoring function
 # -----------------------------
-def score_transcript(text: str, duration_sec: float) -> Dict:
+def extract_features(
+    text: TextInput,
+    engagement: Optional[Tuple[int, float]] = None,
+    timer: StageTimer = NULL_TIMER,
+) -> Dict:
     """
-    Main function: scores transcript according to the rubric.
+    Everything the rubric needs from one transcript's text, independent of
+    its duration and of the band tables: word / sentence counts, tokens,
+    concept flags, structure tags, salutation level, grammar error rate,
+    filler count and VADER pos.
 
-    Components:
-      - Content & Structure: salutation (5) + keywords (30) + flow (5) = 40
-      - Speech Rate: 10
-      - Language & Grammar: grammar (10) + vocab/TTR (10) = 20
-      - Clarity: 15
-      - Engagement: 15
+    score_features() turns this dict into a result; features are what the
+    feature store (enable_feature_store) persists per transcript.
+    """
+    analysis = as_analysis(text)
+    with timer.stage("preprocess"):
+        analysis.clean_text
+    with timer.stage("stats"):
+        stats = analysis.stats
+    total_words = stats["total_words"]
 
-    Total: 100 points.
+    # Content & Structure: salutation level, concept flags and sentence
+    # tags all come from one phrase scan of the cleaned text
+    # (timed together as "phrases")
+    with timer.stage("phrases"):
+        keywords, tags, salutation_score = analysis.phrases
+
+    # Grammar heuristic and filler count (nothing to measure without words)
+    errors_per_100 = 0.0
+    filler_count = 0
+    if total_words:
+        with timer.stage("grammar"):
+            errors_per_100 = _grammar_errors_per_100(analysis, total_words)
+        with timer.stage("clarity"):
+            filler_count = count_filler_words(analysis, FILLER_WORDS)
+
+    if engagement is None:
+        with timer.stage("vader"):
+            engagement = score_engagement(analysis)
+
+    return {
+        "total_words": total_words,
+        "distinct_words": stats["distinct_words"],
+        "sentence_count": stats["sentence_count"],
+        "tokens": stats["tokens"],
+        "concepts": dict(keywords),
+        "tags": tags,
+        "salutation_score": salutation_score,
+        "errors_per_100": errors_per_100,
+        "filler_count": filler_count,
+        "pos": engagement[1],
+    }
 
-    PLUS: Semantic similarity values for each high-level dimension
-           (content, language, clarity, engagement) using sentence embeddings.
+
+def measure(features: Dict, duration_sec: float) -> Dict:
     """
-    clean_text = preprocess_text(text)
-    stats = get_basic_stats(clean_text)
-    tokens = stats["tokens"]
-    total_words = stats["total_words"]
-    distinct_words = stats["distinct_words"]
-    sentences = stats["sentences"]
-    sentence_count = stats["sentence_count"]
+    The raw measurements the rubric's bands and weights are applied to,
+    from extract_features() output and the duration: word count, duration,
+    wpm, errors_per_100, ttr, filler_rate, VADER pos, salutation level,
+    whether the flow is complete, and the concept flags.
 
-    # Content & Structure
-    salutation_score = score_salutation(clean_text)
-    keyword_score, present_kw, missing_kw = score_keywords(clean_text)
-    tags = detect_structure_tags(sentences)
-    flow_score = score_flow(sentences, tags)
+    Every result carries them under "measurements", so stored results can
+    be re-scored under a new rubric without the text (see rescoring).
+    """
+    total_words = features["total_words"]
+    if total_words == 0 or duration_sec <= 0:
+        wpm = 0.0
+    else:
+        wpm = (total_words * 60.0) / duration_sec
 
-    # Speech rate
-    speech_score, wpm = score_speech_rate(total_words, duration_sec)
+    if total_words == 0:
+        errors_per_100 = 0.0
+        filler_rate = 0.0
+        ttr = 0.0
+    else:
+        errors_per_100 = features["errors_per_100"]
+        filler_rate = (features["filler_count"] / total_words) * 100.0
+        ttr = compute_ttr(total_words, features["distinct_words"])
+
+    return {
+        "total_words": total_words,
+        "duration_sec": duration_sec,
+        "wpm": wpm,
+        "errors_per_100": errors_per_100,
+        "ttr": ttr,
+        "filler_rate": filler_rate,
+        "pos": features["pos"],
+        "salutation_score": features["salutation_score"],
+        "has_flow": _has_flow(features["sentence_count"], features["tags"]),
+        "concepts": dict(features["concepts"]),
+    }
 
-    # Grammar & Vocabulary (heuristic grammar, local TTR)
-    grammar_score, errors_per_100 = score_grammar(text, total_words)
-    vocab_score, ttr = score_vocabulary(total_words, distinct_words)
 
-    # Clarity & Engagement
-    clarity_score, filler_rate, filler_count = score_clarity(clean_text, total_words)
-    engagement_score, pos_prob = score_engagement(text)
+def score_features(
+    features: Dict, duration_sec: float, timer: StageTimer = NULL_TIMER
+) -> Dict:
+    """
+    Apply the rubric to extract_features() output.
+
+    Returns the result dict without the semantic fields (see
+    attach_semantics).
+    """
+    total_words = features["total_words"]
+    tags = features["tags"]
+    salutation_score = features["salutation_score"]
+    m = measure(features, duration_sec)
+
+    with timer.stage("keywords"):
+        keyword_score, present_kw, missing_kw = _keyword_score(m["concepts"])
+    with timer.stage("flow"):
+        flow_score = _rubric.flow_points if m["has_flow"] else 0
+
+    # Speech rate (no rate without words or a duration)
+    with timer.stage("speech_rate"):
+        if total_words == 0 or duration_sec <= 0:
+            speech_score = 0
+        else:
+            speech_score = _speech_rate_band(m["wpm"])
+
+    # Grammar, vocabulary and clarity score 0 for an empty transcript.
+    # Stage names match extract_features, whose measurement time they add to.
+    empty = total_words == 0
+    with timer.stage("grammar"):
+        grammar_score = 0 if empty else _grammar_band(m["errors_per_100"])
+    with timer.stage("vocab"):
+        vocab_score = 0 if empty else _vocabulary_band(m["ttr"])
+    with timer.stage("clarity"):
+        clarity_score = 0 if empty else _clarity_band(m["filler_rate"])
+        filler_count = 0 if empty else features["filler_count"]
+    with timer.stage("vader"):
+        engagement_score = _engagement_band(m["pos"])
 
     total_score = (
         salutation_score
@@ -406,21 +954,15 @@ def score_transcript(text: str, duration_sec: float) -> Dict:
         + engagement_score
     )
 
-    # Semantic similarities (0–1) for each major dimension
-    content_sem = compute_semantic_similarity(clean_text, "content")
-    language_sem = compute_semantic_similarity(clean_text, "language")
-    clarity_sem = compute_semantic_similarity(clean_text, "clarity")
-    engagement_sem = compute_semantic_similarity(clean_text, "engagement")
-
     result = {
         "total_score": total_score,
         "stats": {
             "total_words": total_words,
-            "distinct_words": distinct_words,
-            "sentence_count": sentence_count,
-            "tokens": tokens,
+            "distinct_words": features["distinct_words"],
+            "sentence_count": features["sentence_count"],
+            "tokens": features["tokens"],
         },
-        "wpm": wpm,
+        "wpm": m["wpm"],
         "salutation_score": salutation_score,
         "keyword_score": keyword_score,
         "present_keywords": present_kw,
@@ -428,25 +970,465 @@ def score_transcript(text: str, duration_sec: float) -> Dict:
         "flow_score": flow_score,
         "speech_score": speech_score,
         "grammar_score": grammar_score,
-        "errors_per_100": errors_per_100,
+        "errors_per_100": m["errors_per_100"],
         "vocab_score": vocab_score,
-        "ttr": ttr,
+        "ttr": m["ttr"],
         "clarity_score": clarity_score,
-        "filler_rate": filler_rate,
+        "filler_rate": m["filler_rate"],
         "filler_count": filler_count,
         "engagement_score": engagement_score,
-        "pos_prob": pos_prob,
+        "pos_prob": m["pos"],
         "tags": tags,
-        "content_semantic": content_sem,
-        "language_semantic": language_sem,
-        "clarity_semantic": clarity_sem,
-        "engagement_semantic": engagement_sem,
+        "measurements": m,
     }
 
     return result
 
 
+def score_rules(
+    text: TextInput,
+    duration_sec: float,
+    engagement: Optional[Tuple[int, float]] = None,
+    timer: StageTimer = NULL_TIMER,
+) -> Dict:
+    """
+    Run every rule-based stage (and VADER) for one transcript:
+    extract_features() followed by score_features().
+
+    Every stage reads one shared TranscriptAnalysis, so the text is
+    preprocessed, tokenised and split into sentences only once.
+
+    `engagement` is an already computed score_engagement(text) result
+    (e.g. run on another thread); VADER is only called when it is None.
+    `timer` (see instrumentation) records the wall time of each stage.
+
+    Returns the result dict without the semantic fields (see
+    attach_semantics).
+    """
+    features = extract_features(text, engagement=engagement, timer=timer)
+    return score_features(features, duration_sec, timer=timer)
+
+
+def attach_semantics(result: Dict, sems: Optional[Dict[str, float]]) -> Dict:
+    """
+    Add the per-criterion semantic similarities to a rule-based result;
+    with sems=None (fast mode) the fields are present but None.
+    """
+    sems = sems or dict.fromkeys(CRITERION_KEYS)
+    result["content_semantic"] = sems["content"]
+    result["language_semantic"] = sems["language"]
+    result["clarity_semantic"] = sems["clarity"]
+    result["engagement_semantic"] = sems["engagement"]
+    return result
+
+
+# -----------------------------
+# Result cache (opt-in)
+# -----------------------------
+# Part of every cache key, so cached results are never served across a
+# rubric change or a different embedding model. Bump RUBRIC_VERSION
+# whenever a phrase list or the result format changes; band tables and
+# weights are covered by the rubric fingerprint.
+RUBRIC_VERSION = "2"
+
+# Version of extract_features() output kept in the feature store; bump it
+# whenever a phrase list, the grammar heuristic or the filler list changes
+# (band and weight changes need neither).
+FEATURE_VERSION = "1"
+
+_result_cache = None
+
+
+def scorer_version() -> str:
+    return f"rubric-{RUBRIC_VERSION}-{_rubric_fingerprint}:{encoder_model_key()}"
+
+
+def transcript_cache_key(
+    text: str,
+    duration_sec: float,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    mode: str = DEFAULT_SCORING_MODE,
+) -> str:
+    """
+    Content hash identifying one scoring request.
+
+    The raw text is hashed rather than preprocess_text(text): the grammar
+    heuristic and VADER read the original casing and spacing, so two
+    inputs that normalise to the same string can still score differently.
+    """
+    h = hashlib.sha256()
+    h.update(scorer_version().encode("utf-8"))
+    h.update(b"\0")
+    # fast-mode results do not depend on the embedding mode
+    h.update((embedding_mode if mode == "full" else mode).encode("utf-8"))
+    h.update(b"\0")
+    h.update(repr(float(duration_sec)).encode("ascii"))
+    h.update(b"\0")
+    h.update((text or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def enable_result_cache(maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+    """
+    Turn on the in-process LRU cache for score_transcript / score_transcripts
+    results (optionally expiring entries after `ttl` seconds).
+    """
+    global _result_cache
+    _result_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+
+def disable_result_cache() -> None:
+    global _result_cache
+    _result_cache = None
+
+
+def result_cache_enabled() -> bool:
+    return _result_cache is not None
+
+
+def result_cache_stats() -> Optional[Dict]:
+    """
+    Hit / miss / eviction counters of the result cache, or None when disabled.
+    """
+    cache = _result_cache
+    return cache.stats() if cache is not None else None
+
+
+def cached_result(
+    analysis: TranscriptAnalysis,
+    duration_sec: float,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    mode: str = DEFAULT_SCORING_MODE,
+) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Result-cache lookup for one request: (key, copy of the cached result or
+    None). The key is None when the cache is disabled; pass it to
+    cache_result once the result is computed.
+    """
+    cache = _result_cache
+    if cache is None:
+        return None, None
+    key = transcript_cache_key(analysis.raw_text, duration_sec, embedding_mode, mode)
+    cached = cache.get(key)
+    return key, (copy.deepcopy(cached) if cached is not None else None)
+
+
+def cache_result(key: Optional[str], result: Dict) -> None:
+    """
+    Store a copy of `result` under a key from cached_result (no-op for None
+    or with the cache disabled).
+    """
+    cache = _result_cache
+    if cache is not None and key is not None:
+        cache.put(key, copy.deepcopy(result))
+
+
+def split_cached(
+    texts: Sequence[TextInput],
+    durations: Sequence[float],
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    mode: str = DEFAULT_SCORING_MODE,
+) -> Tuple[List[Optional[Dict]], List[Optional[str]], List[int], List[TranscriptAnalysis]]:
+    """
+    cached_result for a batch: (results, keys, pending, analyses), where
+    results holds the cached results (None for the rest), keys the cache
+    keys, and pending / analyses the indices and analyses still to score.
+    """
+    results = [None] * len(texts)
+    keys = [None] * len(texts)
+    pending = []
+    analyses = []
+    for i, (text, duration_sec) in enumerate(zip(texts, durations)):
+        analysis = as_analysis(text)
+        keys[i], results[i] = cached_result(analysis, duration_sec, embedding_mode, mode)
+        if results[i] is None:
+            pending.append(i)
+            analyses.append(analysis)
+    return results, keys, pending, analyses
+
+
+# -----------------------------
+# Feature store (opt-in)
+# -----------------------------
+_feature_store = None
+
+
+def enable_feature_store(path: str) -> FeatureStore:
+    """
+    Read features and document embeddings from the SQLite file at `path`
+    before computing them, and write back whatever had to be computed (see
+    feature_store). Later scoring of the same transcripts, e.g. after a band
+    change, then skips the text analysis and the encoder.
+    """
+    global _feature_store
+    disable_feature_store()
+    _feature_store = FeatureStore(path)
+    return _feature_store
+
+
+def disable_feature_store() -> None:
+    global _feature_store
+    if _feature_store is not None:
+        _feature_store.close()
+    _feature_store = None
+
+
+def get_feature_store() -> Optional[FeatureStore]:
+    return _feature_store
+
+
+def features_for(
+    analyses: List[TranscriptAnalysis], timer: StageTimer = NULL_TIMER
+) -> List[Dict]:
+    """
+    extract_features() for every analysis, through the feature store if enabled.
+    """
+    store = _feature_store
+    if store is None:
+        return [extract_features(analysis, timer=timer) for analysis in analyses]
+
+    hashes = [text_hash(analysis.raw_text) for analysis in analyses]
+    with timer.stage("store_lookup"):
+        found = store.get_features(hashes, FEATURE_VERSION)
+    computed = {}
+    features = []
+    for analysis, h in zip(analyses, hashes):
+        if h not in found and h not in computed:
+            computed[h] = extract_features(analysis, timer=timer)
+        features.append(found.get(h) or computed[h])
+    if computed:
+        with timer.stage("store_write"):
+            store.put_features(computed, FEATURE_VERSION)
+    return features
+
+
+def semantics_for(
+    analyses: List[TranscriptAnalysis],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    timer: StageTimer = NULL_TIMER,
+) -> List[Dict[str, float]]:
+    """
+    compute_semantic_similarities_batch, with document embeddings read from
+    (and written to) the feature store if enabled. Stored vectors are
+    float16, so similarities differ from an unstored run by ~1e-4.
+    """
+    store = _feature_store
+    if store is None:
+        return compute_semantic_similarities_batch(
+            analyses, batch_size=batch_size, embedding_mode=embedding_mode, timer=timer
+        )
+    if not analyses:
+        return []
+
+    model_key = encoder_model_key()
+    hashes = [text_hash(analysis.raw_text) for analysis in analyses]
+    with timer.stage("store_lookup"):
+        vectors = store.get_embeddings(hashes, model_key, embedding_mode)
+
+    missing = {}
+    for analysis, h in zip(analyses, hashes):
+        if h not in vectors:
+            missing.setdefault(h, analysis)
+    if missing:
+        embs = _encode_documents(list(missing.values()), batch_size, embedding_mode, timer)
+        with timer.stage("store_write"):
+            stored = store.put_embeddings(dict(zip(missing, embs)), model_key, embedding_mode)
+            vectors.update(stored)
+
+    with timer.stage("model_load"):
+        criterion_matrix = get_criterion_matrix()
+    return _similarities(criterion_matrix, [vectors[h] for h in hashes], timer)
+
+
+# -----------------------------
+# Background encoding (parallel=True)
+# -----------------------------
+_encode_executor = None
+
+
+def _submit_encode(fn, *args, **kwargs) -> Future:
+    """
+    Run an encoding function on the shared encoder thread.
+
+    A single thread is enough: it only overlaps the encoder with the
+    rule-based stages, and concurrent callers queue behind each other
+    instead of oversubscribing torch's own intra-op threads.
+    """
+    global _encode_executor
+    if _encode_executor is None:
+        with _load_lock:
+            if _encode_executor is None:
+                _encode_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="scorer-encode"
+                )
+    return _encode_executor.submit(fn, *args, **kwargs)
+
+
+# -----------------------------
+# Public scoring API
+# -----------------------------
+def score_transcript(
+    text: TextInput,
+    duration_sec: float,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    parallel: bool = False,
+    timings: bool = False,
+    mode: str = DEFAULT_SCORING_MODE,
+) -> Dict:
+    """
+    Main function: scores transcript according to the rubric.
+
+    Components:
+      - Content & Structure: salutation (5) + keywords (30) + flow (5) = 40
+      - Speech Rate: 10
+      - Language & Grammar: grammar (10) + vocab/TTR (10) = 20
+      - Clarity: 15
+      - Engagement: 15
+
+    Total: 100 points.
+
+    PLUS: Semantic similarity values for each high-level dimension
+           (content, language, clarity, engagement) using sentence embeddings.
+           With mode="fast" these are skipped and left as None (see
+           SCORING_MODES); the rubric score is unchanged.
+
+    `embedding_mode` selects how the transcript is embedded for the
+    semantic stage (see EMBEDDING_MODES).
+
+    With `parallel=True` the encoder starts on a worker thread before the
+    rule-based and VADER stages run (torch releases the GIL while
+    encoding), so latency is roughly the slower of the two instead of
+    their sum.
+
+    With `timings=True` the result gets a "timings" entry with the wall
+    time of every stage and the input size; the same dict is passed to the
+    metrics sink, if one is installed (instrumentation.set_metrics_sink).
+
+    When the result cache is enabled (enable_result_cache), repeated calls
+    with the same text and duration are served from it. When the feature
+    store is enabled (enable_feature_store), stored features and embeddings
+    of the transcript are used instead of recomputing them.
+    """
+    semantic = check_scoring_mode(mode) == "full"
+    sink = get_metrics_sink()
+    timer = StageTimer() if (timings or sink is not None) else NULL_TIMER
+
+    analysis = as_analysis(text)
+
+    key = None
+    if result_cache_enabled():
+        with timer.stage("cache_lookup"):
+            key, cached = cached_result(analysis, duration_sec, embedding_mode, mode)
+        if cached is not None:
+            return _finish_timing(cached, analysis, timer, timings, sink)
+
+    # Semantic similarities (0–1) for each major dimension (one encode)
+    sems_future = None
+    if semantic and parallel:
+        # the encode thread records into its own timer (see StageTimer.merge)
+        encode_timer = StageTimer() if timer.enabled else NULL_TIMER
+        sems_future = _submit_encode(
+            semantics_for, [analysis], embedding_mode=embedding_mode, timer=encode_timer
+        )
+
+    result = score_features(features_for([analysis], timer)[0], duration_sec, timer=timer)
+
+    if not semantic:
+        sems = None
+    elif sems_future is not None:
+        sems = sems_future.result()[0]
+        timer.merge(encode_timer)
+    else:
+        sems = semantics_for([analysis], embedding_mode=embedding_mode, timer=timer)[0]
+    result = attach_semantics(result, sems)
+
+    cache_result(key, result)
+    return _finish_timing(result, analysis, timer, timings, sink)
+
+
+def _finish_timing(
+    result: Dict,
+    analysis: TranscriptAnalysis,
+    timer: StageTimer,
+    timings: bool,
+    sink,
+) -> Dict:
+    if not timer.enabled:
+        return result
+
+    timer.info["input_chars"] = len(analysis.raw_text)
+    timer.info["input_words"] = len(analysis.tokens)
+    report = timer.as_dict()
+    if timings:
+        result["timings"] = report
+    if sink is not None:
+        sink(report)
+    return result
+
+
+def score_transcripts(
+    texts: Sequence[TextInput],
+    durations: Sequence[float],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    embedding_mode: str = DEFAULT_EMBEDDING_MODE,
+    parallel: bool = False,
+    mode: str = DEFAULT_SCORING_MODE,
+) -> List[Dict]:
+    """
+    Batch version of score_transcript.
+
+    Rule-based stages run per transcript; the semantic stage encodes all
+    cleaned transcripts together in mini-batches of `batch_size` (on a
+    worker thread, alongside the rule-based stages, if `parallel`).
+    Inputs already in the result cache (if enabled) are not re-scored, and
+    features and embeddings already in the feature store (if enabled) are
+    read from it.
+    With mode="fast" nothing is encoded (see SCORING_MODES).
+
+    Returns one result dict per input, in input order, with the same
+    fields as score_transcript.
+    """
+    if len(texts) != len(durations):
+        raise ValueError("texts and durations must have the same length")
+    semantic = check_scoring_mode(mode) == "full"
+
+    results, keys, pending, analyses = split_cached(texts, durations, embedding_mode, mode)
+
+    sems_future = None
+    if semantic and parallel:
+        sems_future = _submit_encode(
+            semantics_for,
+            analyses,
+            batch_size=batch_size,
+            embedding_mode=embedding_mode,
+        )
+
+    for i, features in zip(pending, features_for(analyses)):
+        results[i] = score_features(features, durations[i])
+
+    if not semantic:
+        sems_list = [None] * len(pending)
+    elif sems_future is not None:
+        sems_list = sems_future.result()
+    else:
+        sems_list = semantics_for(analyses, batch_size=batch_size, embedding_mode=embedding_mode)
+
+    for i, sems in zip(pending, sems_list):
+        attach_semantics(results[i], sems)
+        cache_result(keys[i], results[i])
+
+    return results
+
+
 if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:2] == ["batch"]:
+        from batch import main as batch_main
+
+        sys.exit(batch_main(sys.argv[2:]))
+
     sample_text = (
         "Hello everyone, my name is Arjun. I am 14 years old and I study in "
         "Class 9 at Sunrise Public School. I live in Bangalore with my parents "
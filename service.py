@@ -0,0 +1,301 @@
+"""
+Local HTTP/JSON scoring service.
+
+Usage:
+    python service.py [--host 127.0.0.1] [--port 8000]
+                      [--window-ms 5] [--max-batch 32] [--encode-batch-size 8]
+                      [--encoder-backend BACKEND]
+
+Endpoints:
+    POST /score   {"text": ..., "duration_sec": ..., "embedding_mode": "document",
+                   "mode": "full"}
+                  -> score_transcript result as JSON ("mode": "fast" skips
+                     the semantic stage, see scoring.SCORING_MODES)
+    GET  /health  -> {"status": "ok"}
+
+Rule-based stages run on the request's own thread. The sentence-transformer
+stage goes through a MicroBatcher: encode requests that arrive within
+--window-ms of each other (up to --max-batch of them) are coalesced into a
+single sem_model.encode call, so throughput grows with load instead of
+every request paying for its own forward pass. Inside that call texts are
+sorted by length and run in mini-batches of --encode-batch-size, so a short
+intro arriving with a long speech is not padded to the speech's length.
+"""
+import argparse
+import json
+import math
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import encoders
+import scoring
+from text_utils import as_analysis
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH = 32
+DEFAULT_ENCODE_BATCH_SIZE = 8
+# Largest request body accepted by POST /score
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+def parse_duration(value) -> float:
+    """
+    duration_sec from a request as a finite float; ValueError otherwise
+    (NaN or infinity would end up in the result and make it invalid JSON).
+    """
+    try:
+        duration_sec = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("duration_sec must be a number") from None
+    if not math.isfinite(duration_sec):
+        raise ValueError("duration_sec must be finite")
+    return duration_sec
+
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent semantic-similarity requests into batched encodes.
+
+    submit() returns a Future; a single background thread waits for the
+    first pending item, then keeps collecting for up to `window_ms` (or
+    until `max_batch` items are queued) and scores them all with one call
+    to scoring.compute_semantic_similarities_batch per embedding mode,
+    which encodes them length-sorted in mini-batches of `encode_batch_size`.
+    """
+
+    def __init__(
+        self,
+        window_ms: float = DEFAULT_WINDOW_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        batch_fn: Optional[Callable[..., List[Dict[str, float]]]] = None,
+        encode_batch_size: int = DEFAULT_ENCODE_BATCH_SIZE,
+    ):
+        if max_batch <= 0 or encode_batch_size <= 0:
+            raise ValueError("max_batch and encode_batch_size must be positive")
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.encode_batch_size = encode_batch_size
+        self.batch_fn = batch_fn or scoring.compute_semantic_similarities_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text, embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE) -> Future:
+        """
+        Queue one text (or TranscriptAnalysis); the Future resolves to its
+        {criterion_key: similarity} dict.
+        """
+        future = Future()
+        self._queue.put((text, embedding_mode, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _collect(self, first) -> Tuple[List, bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                # past the deadline, still take whatever is already queued
+                if timeout > 0:
+                    item = self._queue.get(timeout=timeout)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stop = self._collect(first)
+
+            by_mode = {}
+            for text, mode, future in batch:
+                by_mode.setdefault(mode, []).append((text, future))
+
+            for mode, items in by_mode.items():
+                try:
+                    sims_list = self.batch_fn(
+                        [text for text, _ in items],
+                        batch_size=self.encode_batch_size,
+                        embedding_mode=mode,
+                    )
+                except Exception as exc:
+                    for _, future in items:
+                        future.set_exception(exc)
+                    continue
+                for (_, future), sims in zip(items, sims_list):
+                    future.set_result(sims)
+
+
+def score_with_batcher(
+    batcher: MicroBatcher,
+    text: str,
+    duration_sec: float,
+    embedding_mode: str = scoring.DEFAULT_EMBEDDING_MODE,
+    mode: str = scoring.DEFAULT_SCORING_MODE,
+) -> Dict:
+    """
+    Same result as scoring.score_transcript, with the encode step shared
+    with concurrent callers through `batcher`. The encode is queued first,
+    so it overlaps with the rule-based stages on this thread.
+    """
+    analysis = as_analysis(text)
+    if scoring.check_scoring_mode(mode) == "fast":
+        return scoring.attach_semantics(scoring.score_rules(analysis, duration_sec), None)
+    sims_future = batcher.submit(analysis, embedding_mode)
+    result = scoring.score_rules(analysis, duration_sec)
+    return scoring.attach_semantics(result, sims_future.result())
+
+
+# -----------------------------
+# HTTP layer
+# -----------------------------
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    server_version = "AICommunicationScorer/1.0"
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        # ValueError on NaN/Infinity, before anything is sent
+        body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self.path != "/score":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self._send_json(400, {"error": "bad request: invalid Content-Length"})
+            return
+        if length < 0:
+            self._send_json(400, {"error": "bad request: invalid Content-Length"})
+            return
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {"error": f"request body over {MAX_BODY_BYTES} bytes"})
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            text = payload["text"]
+            duration_sec = parse_duration(payload["duration_sec"])
+            embedding_mode = payload.get("embedding_mode", scoring.DEFAULT_EMBEDDING_MODE)
+            mode = payload.get("mode", scoring.DEFAULT_SCORING_MODE)
+            if not isinstance(text, str):
+                raise ValueError("text must be a string")
+            if embedding_mode not in scoring.EMBEDDING_MODES:
+                raise ValueError(f"embedding_mode must be one of {scoring.EMBEDDING_MODES}")
+            if mode not in scoring.SCORING_MODES:
+                raise ValueError(f"mode must be one of {scoring.SCORING_MODES}")
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {"error": f"bad request: {exc}"})
+            return
+
+        try:
+            result = score_with_batcher(
+                self.server.batcher, text, duration_sec, embedding_mode, mode
+            )
+        except Exception as exc:
+            self._send_json(500, {"error": str(exc)})
+            return
+        try:
+            self._send_json(200, result)
+        except ValueError:
+            # a finite but subnormal duration still overflows wpm to infinity
+            self._send_json(400, {"error": "bad request: duration_sec too small"})
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Bursts of concurrent clients are the point of micro-batching; the
+    # socketserver default backlog of 5 would reset them.
+    request_queue_size = 128
+
+    def __init__(self, address, batcher: MicroBatcher, quiet: bool = False):
+        super().__init__(address, ScoringRequestHandler)
+        self.batcher = batcher
+        self.quiet = quiet
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Local HTTP scoring service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+        help="how long to wait for more requests to join an encode batch",
+    )
+    parser.add_argument(
+        "--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+        help="maximum number of transcripts per encode batch",
+    )
+    parser.add_argument(
+        "--encode-batch-size", type=int, default=DEFAULT_ENCODE_BATCH_SIZE,
+        help="mini-batch size inside a length-sorted encode batch",
+    )
+    parser.add_argument(
+        "--encoder-backend", choices=encoders.ENCODER_BACKENDS, default=None,
+        help=f"encoder backend (default: ${encoders.BACKEND_ENV_VAR} or torch)",
+    )
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.encoder_backend is not None:
+        scoring.set_encoder_backend(args.encoder_backend)
+    scoring.warmup()
+    batcher = MicroBatcher(
+        window_ms=args.window_ms,
+        max_batch=args.max_batch,
+        encode_batch_size=args.encode_batch_size,
+    )
+    server = ScoringHTTPServer((args.host, args.port), batcher, quiet=args.quiet)
+    print(f"Scoring service listening on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+The rubric's band rules as the original if/elif chains, kept verbatim as
+the reference for the band-table tests. A deliberate band change has to
+be made here as well as in rubric.DEFAULT_RUBRIC.
+"""
+import numpy as np
+
+
+def speech_rate_band(wpm: float) -> int:
+    if wpm < 80 or wpm > 161:
+        score = 2
+    elif 81 <= wpm <= 110 or 141 <= wpm <= 160:
+        score = 6
+    elif 111 <= wpm <= 140:
+        score = 10
+    else:
+        score = 2
+
+    return score
+
+
+def grammar_band(errors_per_100: float) -> int:
+    gram_frac = 1 - min(errors_per_100 / 20.0, 1.0)
+
+    if gram_frac > 0.8:
+        score = 10
+    elif 0.6 <= gram_frac <= 0.8:
+        score = 8
+    elif 0.4 <= gram_frac < 0.6:
+        score = 6
+    elif 0.2 <= gram_frac < 0.4:
+        score = 4
+    else:
+        score = 2
+
+    return score
+
+
+def vocabulary_band(ttr: float) -> int:
+    if 0.9 <= ttr <= 1.0:
+        score = 10
+    elif 0.7 <= ttr < 0.9:
+        score = 8
+    elif 0.5 <= ttr < 0.7:
+        score = 6
+    elif 0.3 <= ttr < 0.5:
+        score = 4
+    else:
+        score = 2
+
+    return score
+
+
+def clarity_band(filler_rate: float) -> int:
+    if 0 <= filler_rate <= 3:
+        score = 15
+    elif 4 <= filler_rate <= 6:
+        score = 12
+    elif 7 <= filler_rate <= 9:
+        score = 9
+    elif 10 <= filler_rate <= 12:
+        score = 6
+    else:
+        score = 3
+
+    return score
+
+
+def engagement_band(pos: float) -> int:
+    if pos >= 0.7:
+        score = 15
+    elif 0.5 <= pos < 0.7:
+        score = 12
+    elif 0.3 <= pos < 0.5:
+        score = 9
+    elif 0.1 <= pos < 0.3:
+        score = 6
+    else:
+        score = 3
+
+    return score
+
+
+# Value range to sample and band edges (probed at, and one float either
+# side of, each edge) per rule
+EDGES = {
+    "speech_rate": ((-10.0, 300.0), [80, 81, 110, 111, 140, 141, 160, 161]),
+    "grammar": ((-5.0, 40.0), [0, 4, 8, 12, 16, 20]),
+    "vocabulary": ((-0.2, 1.3), [0.3, 0.5, 0.7, 0.9, 1.0]),
+    "clarity": ((-2.0, 30.0), [0, 3, 4, 6, 7, 9, 10, 12]),
+    "engagement": ((-0.2, 1.2), [0.1, 0.3, 0.5, 0.7]),
+}
+BANDS = {
+    "speech_rate": speech_rate_band,
+    "grammar": grammar_band,
+    "vocabulary": vocabulary_band,
+    "clarity": clarity_band,
+    "engagement": engagement_band,
+}
+
+
+def band_values(name, n=20000, seed=0):
+    """
+    n random values in the rule's range, the special floats and every edge
+    with its neighbouring floats, as a float64 array.
+    """
+    (low, high), edges = EDGES[name]
+    rng = np.random.default_rng(seed)
+    values = list(rng.uniform(low, high, n))
+    values += [float("nan"), float("inf"), float("-inf"), -0.0, 80.5, 110.5, 140.5, 160.5]
+    for edge in edges:
+        values += [edge, np.nextafter(edge, -np.inf), np.nextafter(edge, np.inf)]
+    return np.array(values, dtype=np.float64)
@@ -0,0 +1,71 @@
+"""
+The searchsorted-based array bands must equal the scalar bands element
+for element: on the default rubric (against the original if/elif chains)
+and on random tables with gaps, overlaps, infinite bounds and NaN.
+"""
+import random
+
+import numpy as np
+import pytest
+
+import rubric
+import scoring
+from baseline_bands import BANDS, band_values
+
+ARRAY_BANDS = {
+    "speech_rate": scoring.speech_rate_band_array,
+    "grammar": scoring.grammar_band_array,
+    "vocabulary": scoring.vocabulary_band_array,
+    "clarity": scoring.clarity_band_array,
+    "engagement": scoring.engagement_band_array,
+}
+
+
+@pytest.mark.parametrize("name", sorted(BANDS))
+def test_array_bands_match_if_elif_chains(name):
+    values = band_values(name, seed=1)
+    expected = [BANDS[name](float(v)) for v in values]
+    scores = ARRAY_BANDS[name](values)
+    assert scores.dtype == np.int64
+    assert scores.tolist() == expected
+    # any shape, including 0-d
+    assert ARRAY_BANDS[name](values.reshape(-1, 1))[:, 0].tolist() == expected
+    assert int(ARRAY_BANDS[name](values[0])) == expected[0]
+
+
+def test_speech_rate_gap():
+    wpm = np.array([79.99, 80.0, 80.5, 80.999, 81.0, 110.5, 140.5, 160.5, 161.0, 161.01])
+    assert scoring.speech_rate_band_array(wpm).tolist() == [2, 2, 2, 2, 6, 2, 2, 2, 2, 2]
+
+
+def _random_table(rng):
+    bounds = [None, float("-inf"), float("inf")]
+    bands = []
+    for _ in range(rng.randint(0, 6)):
+        low = rng.choice(bounds + [rng.randint(-5, 5), rng.uniform(-5, 5)])
+        high = rng.choice(bounds + [rng.randint(-5, 5), rng.uniform(-5, 5)])
+        bands.append(rubric.Band(rng.randint(0, 9), low, high, rng.choice(rubric.CLOSED_SIDES)))
+    return rubric.BandTable(bands, rng.randint(0, 9))
+
+
+def test_score_array_matches_score_on_random_tables():
+    rng = random.Random(0)
+    for _ in range(2000):
+        table = _random_table(rng)
+        values = [rng.uniform(-7, 7) for _ in range(100)]
+        values += [float("nan"), float("inf"), float("-inf")]
+        for band in table.bands:
+            for edge in (band.low, band.high):
+                if edge is not None and np.isfinite(edge):
+                    values += [edge, np.nextafter(edge, -np.inf), np.nextafter(edge, np.inf)]
+        assert table.score_array(values).tolist() == [table.score(v) for v in values], (
+            table.bands,
+            table.default,
+        )
+
+
+def test_score_array_follows_table_edits():
+    table = rubric.BandTable([rubric.Band(1, 0, 1)], 0)
+    assert table.score_array([0.5, 2.0]).tolist() == [1, 0]
+    table.bands[0].high = 3
+    assert table.score_array([0.5, 2.0]).tolist() == [1, 1]
@@ -0,0 +1,75 @@
+"""
+The single-scan phrase matcher must agree with the original per-list
+substring scans (baseline_text_utils) on concept flags, sentence tags and
+salutation level.
+"""
+import random
+
+import pytest
+
+import baseline_text_utils as baseline
+import text_utils
+from text_utils import TranscriptAnalysis
+
+PHRASES = sorted(
+    {p for phrases in text_utils.CONCEPT_PHRASES.values() for p in phrases}
+    | set(text_utils.SALUTATION_TAG_PHRASES)
+    | set(text_utils.CLOSING_PHRASES)
+    | {p for phrases in text_utils.SALUTATION_LEVEL_PHRASES.values() for p in phrases}
+)
+FILLER = ["I", "am", "from", "my", "the", "a", "is", "to", "class", "thank", "you", "good",
+          "hello", "everyone", "myself", "years", "school", "i'm", "Hi", "THANK YOU", "ok"]
+PUNCTUATION = [".", "!", "?", ",", "...", "\n", "  "]
+
+
+def _transcripts(n, seed=7):
+    rng = random.Random(seed)
+    texts = ["", " ", ".", "Hello everyone. My name is Ann. Thank you!"]
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(0, 40)):
+            roll = rng.random()
+            if roll < 0.45:
+                part = rng.choice(PHRASES)
+                part = part.upper() if rng.random() < 0.1 else part
+            elif roll < 0.8:
+                part = rng.choice(FILLER)
+            else:
+                part = rng.choice(PUNCTUATION)
+            # sometimes glue fragments together, to hit phrases spanning words
+            parts.append(part if rng.random() < 0.85 else part.strip())
+        texts.append(rng.choice([" ", ""]).join(parts))
+    return texts
+
+
+TRANSCRIPTS = _transcripts(3000)
+
+
+def _expected(text):
+    clean = baseline.preprocess_text(text)
+    sentences = baseline.get_basic_stats(clean)["sentences"]
+    return (
+        baseline.detect_keywords(clean),
+        baseline.detect_structure_tags(sentences),
+        baseline.detect_salutation_level(clean),
+    )
+
+
+@pytest.mark.parametrize("start", range(0, len(TRANSCRIPTS), 500))
+def test_analysis_matches_baseline(start):
+    for text in TRANSCRIPTS[start:start + 500]:
+        analysis = TranscriptAnalysis(text)
+        keywords, tags, level = _expected(text)
+        assert analysis.phrases == (keywords, tags, level), text
+        assert text_utils.analyze_phrases(analysis.clean_text) == (keywords, tags, level), text
+
+
+def test_detectors_match_baseline():
+    for text in TRANSCRIPTS[:1000]:
+        clean = baseline.preprocess_text(text)
+        sentences = baseline.get_basic_stats(clean)["sentences"]
+        assert text_utils.detect_keywords(clean) == baseline.detect_keywords(clean), text
+        assert text_utils.detect_salutation_level(clean) == baseline.detect_salutation_level(clean)
+        assert text_utils.detect_structure_tags(sentences) == baseline.detect_structure_tags(
+            sentences
+        )
@@ -0,0 +1,71 @@
+"""
+rubric.DEFAULT_RUBRIC, applied through scoring's band helpers and through
+rescoring, must give exactly the scores of the original if/elif chains.
+"""
+import random
+
+import pytest
+
+import rescoring
+import rubric
+import scoring
+from baseline_bands import BANDS, band_values
+from text_utils import CONCEPT_PHRASES
+
+SCALAR_BANDS = {
+    "speech_rate": scoring._speech_rate_band,
+    "grammar": scoring._grammar_band,
+    "vocabulary": scoring._vocabulary_band,
+    "clarity": scoring._clarity_band,
+    "engagement": scoring._engagement_band,
+}
+
+
+@pytest.mark.parametrize("name", sorted(BANDS))
+def test_scalar_bands_match_if_elif_chains(name):
+    reference, band = BANDS[name], SCALAR_BANDS[name]
+    for value in band_values(name):
+        assert band(float(value)) == reference(float(value)), value
+
+
+def _random_features(rng):
+    total_words = rng.choice([0, 0, 1, 5, 40, 130, 400])
+    return {
+        "total_words": total_words,
+        "distinct_words": rng.randint(0, total_words) if total_words else 0,
+        "sentence_count": rng.randint(0, 5),
+        "tokens": [],
+        "concepts": {key: rng.random() < 0.5 for key in CONCEPT_PHRASES},
+        "tags": rng.sample(["SALUTATION", "BASIC", "CLOSING", "OTHER"], rng.randint(0, 4)),
+        "salutation_score": rng.choice([0, 2, 4, 5]),
+        "errors_per_100": rng.choice([0.0, rng.uniform(0, 30), 4.0, 12.0]),
+        "filler_count": rng.randint(0, max(total_words // 4, 1)),
+        "pos": rng.choice([rng.random(), 0.1, 0.3, 0.5, 0.7]),
+    }
+
+
+@pytest.mark.parametrize("use_default", [True, False])
+def test_rescoring_matches_score_features(use_default):
+    table = rubric.DEFAULT_RUBRIC
+    if not use_default:
+        table = rubric.Rubric.from_dict(rubric.DEFAULT_RUBRIC.to_dict())
+        table.speech_rate = rubric.BandTable(
+            [rubric.Band(10, 100, 150), rubric.Band(5, 80, 100, "left")], 1
+        )
+        table.must_have_points, table.flow_points = 5, 3
+
+    rng = random.Random(3)
+    features = [_random_features(rng) for _ in range(2000)]
+    durations = [rng.choice([0, -1, 1, 30, 60, 120.5, float("nan"), rng.uniform(5, 120)])
+                 for _ in features]
+    scoring.set_rubric(table)
+    try:
+        results = [scoring.score_features(f, d) for f, d in zip(features, durations)]
+    finally:
+        scoring.set_rubric()
+
+    scores = rescoring.rescore(
+        rescoring.measurement_columns([r["measurements"] for r in results]), table
+    )
+    for field in rescoring.SCORE_FIELDS + ("total_score",):
+        assert scores[field].tolist() == [r[field] for r in results], field
@@ -1,5 +1,8 @@
+import bisect
 import re
-from typing import List, Dict
+from collections import Counter
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple, Union
 
 
 def preprocess_text(text: str) -> str:
@@ -13,10 +16,13 @@ def preprocess_text(text: str) -> str:
     return text.strip().lower()
 
 
-def get_basic_stats(text: str) -> Dict:
+def get_basic_stats(text: Union[str, "TranscriptAnalysis"]) -> Dict:
     """
     Compute basic stats: tokens, counts, sentences.
     """
+    if isinstance(text, TranscriptAnalysis):
+        return text.stats
+
     clean = text.strip()
     if not clean:
         return {
@@ -52,20 +58,21 @@ def compute_ttr(total_words: int, distinct_words: int) -> float:
     return distinct_words / total_words
 
 
-def count_filler_words(text: str, fillers: List[str]) -> int:
+def count_filler_words(text: Union[str, "TranscriptAnalysis"], fillers: List[str]) -> int:
     """
     Count filler words (single and multi-word).
     """
-    if not text:
+    if isinstance(text, TranscriptAnalysis):
+        text_lower = text.clean_text
+        token_counts = text.token_counts
+    else:
+        text_lower = text.lower() if text else ""
+        # For counting single-word fillers, use tokens
+        token_counts = Counter(text_lower.split())
+
+    if not text_lower:
         return 0
 
-    text_lower = text.lower()
-    # For counting single-word fillers, use tokens
-    tokens = text_lower.split()
-    token_counts = {}
-    for t in tokens:
-        token_counts[t] = token_counts.get(t, 0) + 1
-
     count = 0
     for f in fillers:
         f = f.lower().strip()
@@ -78,250 +85,425 @@ def count_filler_words(text: str, fillers: List[str]) -> int:
     return count
 
 
-def detect_salutation_level(text: str) -> int:
-    """
-    Returns 0, 2, 4, or 5 based on first sentence.
-    """
-    if not text:
-        return 0
-
-    stats = get_basic_stats(text)
-    sentences = stats["sentences"]
-    if not sentences:
-        return 0
-
-    first = sentences[0].lower()
+# -----------------------------
+# Phrase tables
+# -----------------------------
+# Every phrase list lives here once; the document-level concept flags, the
+# per-sentence structure tags and the salutation level are all derived from
+# a single scan with PHRASE_MATCHER (see analyze_phrases).
 
+# Rubric concepts (key -> trigger phrases), in the order detect_keywords reports them
+CONCEPT_PHRASES = {
+    # Must-have
+    "has_name": ["my name is", "myself", "i am "],
+    "has_age": ["years old"],
+    "has_school_class": ["class ", "standard", "grade ", "school"],
+    "has_family": ["family", "mother", "father", "parents", "brother", "sister"],
+    "has_hobbies": [
+        "my hobby is",
+        "my hobbies are",
+        "i like to",
+        "i love to",
+        "i enjoy",
+        "in my free time",
+    ],
+    # Good-to-have
+    # about family - more than just one word "family"
+    "has_about_family": [
+        "my family is",
+        "we are a family of",
+        "there are",
+        "members in my family",
+    ],
+    "has_location": ["i am from", "i'm from", "i live in", "my hometown"],
+    "has_ambition": [
+        "i want to become",
+        "i want to be",
+        "my dream is",
+        "my goal is",
+        "my ambition is",
+    ],
+    "has_fun_fact": [
+        "fun fact",
+        "something unique about me",
+        "one thing about me",
+        "an interesting thing about me",
+    ],
+    "has_strengths_or_achievements": [
+        "i am good at",
+        "i'm good at",
+        "my strength is",
+        "my strengths are",
+        "i have won",
+        "i won",
+        "i achieved",
+        "i have achieved",
+    ],
+}
+
+# Concepts that make a sentence BASIC / ADDITIONAL in detect_structure_tags
+BASIC_CONCEPTS = frozenset(["has_name", "has_age", "has_school_class", "has_location"])
+ADDITIONAL_CONCEPTS = frozenset(
+    [
+        "has_family",
+        "has_hobbies",
+        "has_ambition",
+        "has_fun_fact",
+        "has_strengths_or_achievements",
+    ]
+)
+
+# Sentence tags
+SALUTATION_TAG_PHRASES = [
+    "good morning",
+    "good afternoon",
+    "good evening",
+    "hello",
+    "hi",
+    "hey",
+    "excited to introduce myself",
+    "thrilled to introduce myself",
+    "excited to be here",
+    "thrilled to be here",
+]
+CLOSING_PHRASES = ["thank you", "thanks for listening", "that's all"]
+
+# Salutation level of the first sentence (checked from highest to lowest)
+SALUTATION_LEVEL_PHRASES = {
     # Most enthusiastic
-    enthusiastic_phrases = [
+    5: [
         "excited to introduce myself",
         "thrilled to introduce myself",
         "thrilled to be here",
         "excited to be here",
         "i am excited to introduce",
         "i'm excited to introduce",
-    ]
-    for p in enthusiastic_phrases:
-        if p in first:
-            return 5
-
+    ],
     # Good formal greetings
-    formal_greetings = [
+    4: [
         "good morning",
         "good afternoon",
         "good evening",
         "hello everyone",
         "hello everybody",
-    ]
-    for p in formal_greetings:
-        if p in first:
-            return 4
-
+    ],
     # Simple greetings
-    simple_greetings = [
+    2: [
         "hello",
         "hi",
         "hey",
-    ]
-    for p in simple_greetings:
-        # avoid double-counting "hello everyone" which we handled above
-        if p in first:
-            return 2
+    ],
+}
+
+
+def _salutation_level_label(level: int) -> str:
+    return f"SALUTATION_LEVEL_{level}"
+
 
+# -----------------------------
+# Multi-phrase matcher
+# -----------------------------
+def _trie_pattern(phrases: List[str]) -> str:
+    """
+    Regex for a set of literal phrases, factored as a trie so that at each
+    position only the branches sharing the next character are tried. Greedy
+    optional tails make it return the longest phrase starting there.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [
+            re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """
+    Finds every occurrence of many literal phrases in one left-to-right scan.
+
+    Each phrase carries a set of labels. The phrases are compiled once into
+    a single trie-shaped regex, so a scan costs O(len(text)) instead of
+    O(len(text) * number_of_phrases) for repeated `p in text` checks.
+    Overlapping matches are kept: when several phrases start at the same
+    position the regex reports the longest one, and all phrases that are a
+    prefix of it are reported with it.
+    """
+
+    def __init__(self, phrase_labels: Dict[str, FrozenSet[str]]):
+        phrases = sorted(phrase_labels)
+        # longest phrase -> [(length, labels)] for itself and its prefix phrases
+        self._hits = {
+            phrase: [
+                (len(prefix), phrase_labels[prefix])
+                for prefix in phrases
+                if phrase.startswith(prefix)
+            ]
+            for phrase in phrases
+        }
+        self._regex = re.compile(_trie_pattern(phrases))
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, List[Tuple[int, FrozenSet[str]]]]]:
+        """
+        Yield (start, [(length, labels), ...]) for every position where at
+        least one phrase starts.
+        """
+        hits = self._hits
+        search = self._regex.search
+        pos = 0
+        while True:
+            m = search(text, pos)
+            if m is None:
+                return
+            yield m.start(), hits[m.group()]
+            # restart right after the match start so overlapping phrases are found
+            pos = m.start() + 1
+
+    def labels(self, text: str) -> Set[str]:
+        """
+        Union of the labels of every phrase occurring in text.
+        """
+        found = set()
+        for _, hits in self.finditer(text):
+            for _, labels in hits:
+                found |= labels
+        return found
+
+
+def _build_phrase_matcher() -> PhraseMatcher:
+    phrase_labels = {}
+
+    def add(phrases: List[str], label: str) -> None:
+        for phrase in phrases:
+            phrase_labels.setdefault(phrase, set()).add(label)
+
+    for key, phrases in CONCEPT_PHRASES.items():
+        add(phrases, key)
+    add(SALUTATION_TAG_PHRASES, "SALUTATION")
+    add(CLOSING_PHRASES, "CLOSING")
+    for level, phrases in SALUTATION_LEVEL_PHRASES.items():
+        add(phrases, _salutation_level_label(level))
+
+    return PhraseMatcher({p: frozenset(labels) for p, labels in phrase_labels.items()})
+
+
+PHRASE_MATCHER = _build_phrase_matcher()
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    (start, end) offsets into `text` of the sentences get_basic_stats would
+    return, i.e. text[start:end] == sentence for each of them.
+    """
+    spans = []
+    for m in re.finditer(r"[^.!?]+", text):
+        segment = m.group()
+        stripped = segment.strip()
+        if stripped:
+            start = m.start() + len(segment) - len(segment.lstrip())
+            spans.append((start, start + len(stripped)))
+    return spans
+
+
+def _scan_labels(
+    text: str, spans: List[Tuple[int, int]]
+) -> Tuple[Set[str], List[Set[str]]]:
+    """
+    One matcher pass over text. Returns the labels found anywhere in the
+    text and, for each span, the labels of phrases lying fully inside it.
+    """
+    doc_labels = set()
+    span_labels = [set() for _ in spans]
+    span_starts = [start for start, _ in spans]
+
+    for start, hits in PHRASE_MATCHER.finditer(text):
+        idx = bisect.bisect_right(span_starts, start) - 1
+        span_end = spans[idx][1] if idx >= 0 else -1
+        for length, labels in hits:
+            doc_labels |= labels
+            if start + length <= span_end:
+                span_labels[idx] |= labels
+
+    return doc_labels, span_labels
+
+
+def _keywords_from_labels(labels: Set[str]) -> Dict[str, bool]:
+    return {key: key in labels for key in CONCEPT_PHRASES}
+
+
+def _tag_from_labels(labels: Set[str]) -> str:
+    if "SALUTATION" in labels:
+        return "SALUTATION"
+    if "CLOSING" in labels:
+        return "CLOSING"
+    if labels & BASIC_CONCEPTS:
+        return "BASIC"
+    if labels & ADDITIONAL_CONCEPTS:
+        return "ADDITIONAL"
+    return "OTHER"
+
+
+def _salutation_level_from_labels(labels: Set[str]) -> int:
+    for level in sorted(SALUTATION_LEVEL_PHRASES, reverse=True):
+        if _salutation_level_label(level) in labels:
+            return level
     return 0
 
 
-def detect_keywords(text: str) -> Dict[str, bool]:
+def analyze_phrases(
+    text: Union[str, "TranscriptAnalysis"]
+) -> Tuple[Dict[str, bool], List[str], int]:
     """
-    Detect presence of rubric 'concepts' using simple patterns.
+    Single pass over the text producing everything the phrase rules need:
+
+      - concept flags (same as detect_keywords(text))
+      - one structure tag per sentence (same as
+        detect_structure_tags(get_basic_stats(text)["sentences"]))
+      - salutation level (same as detect_salutation_level(text))
     """
-    t = text.lower()
+    if isinstance(text, TranscriptAnalysis):
+        return text.phrases
 
-    # Must-have
-    has_name = any(p in t for p in ["my name is", "myself", "i am "])
-    has_age = "years old" in t
-    has_school_class = any(p in t for p in ["class ", "standard", "grade ", "school"])
-    has_family = any(
-        p in t for p in ["family", "mother", "father", "parents", "brother", "sister"]
-    )
-    has_hobbies = any(
-        p in t
-        for p in [
-            "my hobby is",
-            "my hobbies are",
-            "i like to",
-            "i love to",
-            "i enjoy",
-            "in my free time",
-        ]
-    )
+    t = text.lower() if text else ""
+    return _analyze_spans(t, sentence_spans(t))
 
-    # Good-to-have
-    # about family - more than just one word "family"
-    has_about_family = any(
-        p in t
-        for p in [
-            "my family is",
-            "we are a family of",
-            "there are",
-            "members in my family",
-        ]
-    )
-    has_location = any(p in t for p in ["i am from", "i'm from", "i live in", "my hometown"])
-    has_ambition = any(
-        p in t
-        for p in [
-            "i want to become",
-            "i want to be",
-            "my dream is",
-            "my goal is",
-            "my ambition is",
-        ]
-    )
-    has_fun_fact = any(
-        p in t
-        for p in [
-            "fun fact",
-            "something unique about me",
-            "one thing about me",
-            "an interesting thing about me",
-        ]
-    )
-    has_strengths_or_achievements = any(
-        p in t
-        for p in [
-            "i am good at",
-            "i'm good at",
-            "my strength is",
-            "my strengths are",
-            "i have won",
-            "i won",
-            "i achieved",
-            "i have achieved",
-        ]
-    )
 
-    return {
-        "has_name": has_name,
-        "has_age": has_age,
-        "has_school_class": has_school_class,
-        "has_family": has_family,
-        "has_hobbies": has_hobbies,
-        "has_about_family": has_about_family,
-        "has_location": has_location,
-        "has_ambition": has_ambition,
-        "has_fun_fact": has_fun_fact,
-        "has_strengths_or_achievements": has_strengths_or_achievements,
-    }
+def _analyze_spans(
+    t: str, spans: List[Tuple[int, int]]
+) -> Tuple[Dict[str, bool], List[str], int]:
+    doc_labels, span_labels = _scan_labels(t, spans)
 
+    keywords = _keywords_from_labels(doc_labels)
+    tags = [_tag_from_labels(labels) for labels in span_labels]
+    salutation_level = _salutation_level_from_labels(span_labels[0]) if spans else 0
+    return keywords, tags, salutation_level
+
+
+def detect_salutation_level(text: Union[str, "TranscriptAnalysis"]) -> int:
+    """
+    Returns 0, 2, 4, or 5 based on first sentence.
+    """
+    if isinstance(text, TranscriptAnalysis):
+        return text.phrases[2]
+
+    if not text:
+        return 0
+
+    t = text.lower()
+    spans = sentence_spans(t)
+    if not spans:
+        return 0
+
+    start, end = spans[0]
+    return _salutation_level_from_labels(PHRASE_MATCHER.labels(t[start:end]))
 
-def _sentence_has_basic(s: str) -> bool:
-    s = s.lower()
-    if any(p in s for p in ["my name is", "myself", "i am "]):
-        return True
-    if "years old" in s:
-        return True
-    if any(p in s for p in ["class ", "standard", "grade ", "school"]):
-        return True
-    if any(p in s for p in ["i am from", "i live in", "i'm from", "my hometown"]):
-        return True
-    return False
-
-
-def _sentence_has_additional(s: str) -> bool:
-    s = s.lower()
-    if any(p in s for p in ["family", "mother", "father", "parents", "brother", "sister"]):
-        return True
-    if any(
-        p in s
-        for p in [
-            "my hobby is",
-            "my hobbies are",
-            "i like to",
-            "i love to",
-            "i enjoy",
-            "in my free time",
-        ]
-    ):
-        return True
-    if any(
-        p in s
-        for p in [
-            "i want to become",
-            "i want to be",
-            "my dream is",
-            "my goal is",
-            "my ambition is",
-        ]
-    ):
-        return True
-    if any(
-        p in s
-        for p in [
-            "fun fact",
-            "something unique about me",
-            "one thing about me",
-            "an interesting thing about me",
-        ]
-    ):
-        return True
-    if any(
-        p in s
-        for p in [
-            "i am good at",
-            "i'm good at",
-            "my strength is",
-            "my strengths are",
-            "i have won",
-            "i won",
-            "i achieved",
-            "i have achieved",
-        ]
-    ):
-        return True
-    return False
-
-
-def _sentence_has_salutation(s: str) -> bool:
-    s = s.lower()
-    if any(p in s for p in ["good morning", "good afternoon", "good evening"]):
-        return True
-    if any(p in s for p in ["hello", "hi", "hey"]):
-        return True
-    if any(
-        p in s
-        for p in [
-            "excited to introduce myself",
-            "thrilled to introduce myself",
-            "excited to be here",
-            "thrilled to be here",
-        ]
-    ):
-        return True
-    return False
 
+def detect_keywords(text: Union[str, "TranscriptAnalysis"]) -> Dict[str, bool]:
+    """
+    Detect presence of rubric 'concepts' using simple patterns.
+    """
+    if isinstance(text, TranscriptAnalysis):
+        return text.phrases[0]
 
-def _sentence_has_closing(s: str) -> bool:
-    s = s.lower()
-    if "thank you" in s or "thanks for listening" in s or "that's all" in s:
-        return True
-    return False
+    return _keywords_from_labels(PHRASE_MATCHER.labels(text.lower()))
 
 
-def detect_structure_tags(sentences: List[str]) -> List[str]:
+def detect_structure_tags(sentences: Union[List[str], "TranscriptAnalysis"]) -> List[str]:
     """
     Tag each sentence as SALUTATION / BASIC / ADDITIONAL / CLOSING / OTHER.
     """
-    tags = []
-    for s in sentences:
-        if _sentence_has_salutation(s):
-            tags.append("SALUTATION")
-        elif _sentence_has_closing(s):
-            tags.append("CLOSING")
-        elif _sentence_has_basic(s):
-            tags.append("BASIC")
-        elif _sentence_has_additional(s):
-            tags.append("ADDITIONAL")
-        else:
-            tags.append("OTHER")
-    return tags
+    if isinstance(sentences, TranscriptAnalysis):
+        return sentences.phrases[1]
+
+    return [_tag_from_labels(PHRASE_MATCHER.labels(s.lower())) for s in sentences]
+
+
+# -----------------------------
+# Shared per-transcript analysis
+# -----------------------------
+class TranscriptAnalysis:
+    """
+    One transcript plus every derived view the scorers need, each computed
+    lazily and at most once.
+
+    The scoring functions in this module and in scoring.py accept either a
+    plain string (original behaviour) or a TranscriptAnalysis. Given an
+    analysis, each function reads the view score_transcript has always fed
+    it: grammar and sentiment read `raw_text` / `lower_text`, everything
+    else reads the preprocessed `clean_text` and the views built from it.
+    """
+
+    def __init__(self, text: str):
+        self.raw_text = text or ""
+
+    @cached_property
+    def lower_text(self) -> str:
+        return self.raw_text.lower()
+
+    @cached_property
+    def raw_tokens(self) -> List[str]:
+        return self.raw_text.split()
+
+    @cached_property
+    def clean_text(self) -> str:
+        return preprocess_text(self.raw_text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        return self.clean_text.split()
+
+    @cached_property
+    def token_counts(self) -> Counter:
+        return Counter(self.tokens)
+
+    @cached_property
+    def sentence_offsets(self) -> List[Tuple[int, int]]:
+        """
+        (start, end) of each sentence within clean_text.
+        """
+        return sentence_spans(self.clean_text)
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        clean = self.clean_text
+        return [clean[start:end] for start, end in self.sentence_offsets]
+
+    @cached_property
+    def stats(self) -> Dict:
+        """
+        Same dict as get_basic_stats(clean_text).
+        """
+        return {
+            "tokens": self.tokens,
+            "total_words": len(self.tokens),
+            "distinct_words": len(self.token_counts),
+            "sentences": self.sentences,
+            "sentence_count": len(self.sentences),
+        }
+
+    @cached_property
+    def phrases(self) -> Tuple[Dict[str, bool], List[str], int]:
+        """
+        (concept flags, sentence tags, salutation level) from one phrase scan.
+        """
+        return _analyze_spans(self.clean_text, self.sentence_offsets)
+
+
+def as_analysis(text: Union[str, TranscriptAnalysis]) -> TranscriptAnalysis:
+    """
+    Wrap a plain transcript in a TranscriptAnalysis (analyses pass through).
+    """
+    return text if isinstance(text, TranscriptAnalysis) else TranscriptAnalysis(text)